@@ -4,8 +4,17 @@ from __future__ import annotations
 
 import hashlib
 
+_SEPARATOR = b"||"
+
 
 def compute_source_id(normalized_text: str, source: str) -> str:
-    """Compute deterministic SHA-256 source id using normalized text and source."""
-    payload = f"{normalized_text}||{source}".encode("utf-8")
-    return hashlib.sha256(payload).hexdigest()
+    """Compute deterministic SHA-256 source id using normalized text and source.
+
+    The digest must stay the same as ``sha256(f"{text}||{source}")``: existing notes and
+    Notion pages are deduplicated by it, so the pieces are fed incrementally instead of
+    switching algorithms.
+    """
+    digest = hashlib.sha256(normalized_text.encode("utf-8"))
+    digest.update(_SEPARATOR)
+    digest.update(source.encode("utf-8"))
+    return digest.hexdigest()
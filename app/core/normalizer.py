@@ -11,6 +11,7 @@ _SIGNATURE_MARKERS = (
     "kind regards",
     "--",
 )
+_SPACES_RE = re.compile(r"[ \t]+")
 
 
 def normalize_newlines(text: str) -> str:
@@ -21,10 +22,10 @@ def normalize_newlines(text: str) -> str:
 
 def collapse_spaces(text: str) -> str:
     """Collapse repeated spaces and tabs while preserving line breaks."""
-    lines = []
-    for line in text.split("\n"):
-        lines.append(re.sub(r"[ \t]+", " ", line).strip())
-    return "\n".join(lines).strip()
+    # [ \t] nunca cruza un salto de línea: basta una sustitución sobre todo el texto,
+    # y solo hace falta si hay tabuladores o espacios repetidos.
+    collapsed = _SPACES_RE.sub(" ", text) if "\t" in text or "  " in text else text
+    return "\n".join(line.strip() for line in collapsed.split("\n")).strip()
 
 
 def _strip_signature_conservative(text: str) -> str:
@@ -32,7 +33,7 @@ def _strip_signature_conservative(text: str) -> str:
     lines = text.split("\n")
     for i in range(len(lines) - 1, -1, -1):
         candidate = lines[i].strip().lower()
-        if any(candidate.startswith(marker) for marker in _SIGNATURE_MARKERS):
+        if candidate.startswith(_SIGNATURE_MARKERS):
             # Keep marker line only if it is very near start (avoid deleting full content)
             if i > max(2, len(lines) // 3):
                 return "\n".join(lines[:i]).strip()
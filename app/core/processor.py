@@ -139,11 +139,14 @@ def process_text(text: str) -> ProcessedNote:
         logger.exception("No se pudo procesar texto con OpenAI: %s", exc)
         return _empty_processed_note()
 
-    acciones = _normalize_actions(payload.get("acciones", []))
+    return _processed_note_from_payload(payload)
 
+
+def _processed_note_from_payload(payload: dict) -> ProcessedNote:
+    """Build the ProcessedNote from the already parsed JSON object returned by the model."""
     return ProcessedNote(
         resumen=str(payload.get("resumen", "") or "").strip(),
-        acciones=acciones,
+        acciones=_normalize_actions(payload.get("acciones", [])),
         tipo_sugerido=str(payload.get("tipo_sugerido", "") or "").strip(),
         prioridad_sugerida=str(payload.get("prioridad_sugerida", "") or "").strip(),
     )
@@ -25,6 +25,7 @@ NOTION_DISABLED_MESSAGE = (
     "La integración con Notion está desactivada. "
     "Sansebas Nexus guardará la información localmente."
 )
+_DUPLICATE_NOTE_MESSAGE = "Nota duplicada detectada, no se guardó nuevamente."
 
 
 class NoteService:
@@ -50,11 +51,17 @@ class NoteService:
         self.masters_repo = masters_repo
         self.actions_repo = actions_repo
         self.outlook_service = outlook_service or OutlookService(note_repo.conn)
+        self._masters_cache: dict[str, list[str]] = {}
         self.masters_repo.ensure_default_values()
 
     def get_settings(self) -> AppSettings:
         return self.settings_repo.load()
 
+    def reload_caches(self) -> None:
+        """Forget cached settings and masters; another connection may have changed them."""
+        self.settings_repo.reload()
+        self._masters_cache.clear()
+
     def save_settings(self, settings: AppSettings) -> None:
         self.settings_repo.save(settings)
         logger.info("NOTION_INTEGRATION: %s", "enabled" if settings.notion_enabled else "disabled")
@@ -73,11 +80,29 @@ class NoteService:
     def get_setting(self, key: str) -> str | None:
         return self.settings_repo.get_setting(key)
 
-    def list_notes(self, limit: int = 200) -> list[Note]:
-        return self.note_repo.list_notes(limit)
+    def list_notes(self, limit: int = 200, offset: int = 0) -> list[Note]:
+        return self.note_repo.list_notes(limit, offset)
 
     def get_master_values(self, field_name: str) -> list[str]:
-        return self.masters_repo.list_active(field_name)
+        cached = self._masters_cache.get(field_name)
+        if cached is None:
+            cached = self.masters_repo.list_active(field_name)
+            self._masters_cache[field_name] = cached
+        return list(cached)
+
+    def get_master_values_bulk(self, categories: list[str]) -> dict[str, list[str]]:
+        missing = [category for category in categories if category not in self._masters_cache]
+        if missing:
+            fetched = self.masters_repo.list_active_bulk(missing)
+            for category in missing:
+                self._masters_cache[category] = fetched.get(category, [])
+        return {category: list(self._masters_cache[category]) for category in categories}
+
+    def invalidate_master_values(self, category: str | None = None) -> None:
+        if category is None:
+            self._masters_cache.clear()
+        else:
+            self._masters_cache.pop(category, None)
 
     def list_masters(self, category: str):
         return self.masters_repo.list_all(category)
@@ -85,11 +110,13 @@ class NoteService:
     def add_master(self, category: str, value: str, description: str = "") -> None:
         logger.info("MASTERS: operación local sin Notion add category=%s value=%s", category, value)
         self.masters_repo.add_master(category, value, description)
+        self.invalidate_master_values(category)
 
     def update_master(self, category: str, old_value: str, new_value: str, description: str) -> None:
         if old_value != new_value and self.masters_repo.is_locked(category, old_value):
             raise ValueError(f"'{old_value}' está bloqueado por el sistema y no puede renombrarse.")
         self.masters_repo.update_master(category, old_value, new_value, description)
+        self.invalidate_master_values(category)
 
     def deactivate_master(self, category: str, value: str) -> None:
         if self.masters_repo.is_locked(category, value):
@@ -97,6 +124,7 @@ class NoteService:
 
         logger.info("MASTERS: operación local sin Notion deactivate category=%s value=%s", category, value)
         self.masters_repo.deactivate_master(category, value)
+        self.invalidate_master_values(category)
 
     def sync_schema_with_notion(self, settings: AppSettings | None = None) -> None:
         current = settings or self.get_settings()
@@ -484,8 +512,9 @@ Un saludo""",
         normalized = normalize_text(req.raw_text, req.source)
         source_id = req.email_id.strip() if req.source == "email_pasted" and req.email_id.strip() else compute_source_id(normalized, req.source)
 
+        # Comprobación previa para no pagar process_text (OpenAI) con notas ya guardadas.
         if self.note_repo.source_exists(source_id):
-            return None, "Nota duplicada detectada, no se guardó nuevamente."
+            return None, _DUPLICATE_NOTE_MESSAGE
 
         title = req.title.strip() if req.title else ""
         if not title:
@@ -516,12 +545,16 @@ Un saludo""",
             resumen=processed.resumen,
             acciones=acciones_text,
         )
+        created_at = AppSettings.now_iso()
         note_id = self.note_repo.create_note(
             final_req,
             source_id=source_id,
-            created_at=AppSettings.now_iso(),
+            created_at=created_at,
             status=NoteStatus.PENDING,
         )
+        if note_id is None:
+            # Otra ruta (p. ej. la ingesta de correo) guardó la misma nota mientras se procesaba.
+            return None, _DUPLICATE_NOTE_MESSAGE
 
         for accion in filtered_actions:
             try:
@@ -533,6 +566,7 @@ Un saludo""",
                     note_id=note_id,
                     description=action_description,
                     area=final_req.area,
+                    created_at=created_at,
                 )
 
             except Exception:  # noqa: BLE001
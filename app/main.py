@@ -17,7 +17,7 @@ from app.persistence.masters_repository import MastersRepository
 from app.persistence.repositories import ActionsRepository, NoteRepository, SettingsRepository
 from app.ui.app_icons import apply_app_icon
 from app.ui.main_window import MainWindow
-from app.utils.logging_config import configure_logging
+from app.utils.logging_config import configure_logging, stop_logging
 
 
 def main() -> None:
@@ -32,6 +32,16 @@ def main() -> None:
 
     service = NoteService(NoteRepository(conn), SettingsRepository(conn), masters_repo, ActionsRepository(conn))
 
+    def open_worker_service() -> NoteService:
+        # Cada hilo de fondo de la ventana usa su propia conexión a la misma base.
+        worker_conn = db.connect()
+        return NoteService(
+            NoteRepository(worker_conn),
+            SettingsRepository(worker_conn),
+            MastersRepository(worker_conn),
+            ActionsRepository(worker_conn),
+        )
+
     if TkinterDnD is not None:
         root = TkinterDnD.Tk()
         logging.getLogger(__name__).info("APP_DND: TkinterDnD disponible, root creada con TkinterDnD.Tk")
@@ -41,11 +51,14 @@ def main() -> None:
     root.title(APP_NAME)
     root.geometry("980x720")
     apply_app_icon(root)
-    MainWindow(root, service, db_connection=conn)
+    MainWindow(root, service, db_connection=conn, service_factory=open_worker_service)
 
     logging.getLogger(__name__).info("SANSEBAS_NEXUS: application started")
     logging.getLogger(__name__).info("App iniciada. Log: %s", log_path)
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
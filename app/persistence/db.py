@@ -425,21 +425,48 @@ def run_migrations(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+# WAL permite leer mientras otro hilo escribe y, con synchronous=NORMAL, evita un fsync por commit.
+_DURABLE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+# Todos los repositorios comparten una conexión y suman más de 128 sentencias distintas
+# (el tamaño por defecto de la caché de sentencias preparadas de sqlite3).
+_STATEMENT_CACHE_SIZE = 512
+# Para bases desechables (tests): sin fichero de journal ni fsync.
+_SCRATCH_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
 class Database:
     """Simple SQLite wrapper with schema migrations."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path | str, durable: bool = True):
         self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Las URI ("file:...?mode=memory&cache=shared") no tienen carpeta que crear.
+        self._uri = isinstance(db_path, str) and db_path.startswith("file:")
+        if not self._uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pragmas = _DURABLE_PRAGMAS if durable else _SCRATCH_PRAGMAS
 
     def connect(self) -> sqlite3.Connection:
-        """Create a connection with row factory enabled."""
+        """Create a connection with row factory enabled and the connection PRAGMAs applied."""
         conn = sqlite3.connect(
             database=str(self.db_path),
             check_same_thread=False,
             timeout=30.0,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+            uri=self._uri,
         )
         conn.row_factory = sqlite3.Row
+        for pragma in self._pragmas:
+            conn.execute(pragma)
         return conn
 
     def migrate(self) -> None:
@@ -557,6 +584,13 @@ class Database:
                 ON actions(status, area)
                 """
             )
+            # Partial index: pending_count_by_note only probes open actions.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_actions_open_by_note
+                ON actions(note_id) WHERE status <> 'hecha'
+                """
+            )
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS pedidos (
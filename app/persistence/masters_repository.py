@@ -66,6 +66,25 @@ class MastersRepository:
         ).fetchall()
         return [str(row["value"]) for row in rows]
 
+    def list_active_bulk(self, categories: list[str]) -> dict[str, list[str]]:
+        """Return active values for several categories with a single query."""
+        result: dict[str, list[str]] = {category: [] for category in categories}
+        if not categories:
+            return result
+        placeholders = ", ".join("?" for _ in categories)
+        rows = self.conn.execute(
+            f"""
+            SELECT category, value
+            FROM masters
+            WHERE category IN ({placeholders}) AND active = 1
+            ORDER BY id ASC
+            """,
+            tuple(categories),
+        ).fetchall()
+        for row in rows:
+            result[str(row["category"])].append(str(row["value"]))
+        return result
+
     def list_all(self, category: str) -> list[sqlite3.Row]:
         return self.conn.execute(
             """
@@ -3,12 +3,62 @@
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import fields
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from dataclasses import fields, replace
+from typing import Iterable, Optional
 
 from app.core.models import Action, AppSettings, Note, NoteCreateRequest, NoteStatus
 
+# Explicit column lists in dataclass field order so list queries can build
+# entities positionally from plain tuples, regardless of physical column order.
+_NOTE_COLUMNS = ", ".join(f.name for f in fields(Note))
+_ACTION_COLUMNS = ", ".join(f"a.{f.name}" for f in fields(Action))
+
+
+_INSERT_NOTE_SQL = """
+    INSERT INTO notes_local (
+        created_at, source, source_id, title, raw_text, area, tipo, estado, prioridad, fecha, hora_inicio, duracion, hora_fin, resumen, acciones, status, google_event_id, google_calendar_link, google_calendar_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id) DO NOTHING
+"""
+
+
+def _note_insert_row(req: NoteCreateRequest, source_id: str, created_at: str, status: NoteStatus) -> tuple:
+    """Return the parameters of ``_INSERT_NOTE_SQL`` for one note."""
+    return (
+        created_at,
+        req.source,
+        source_id,
+        req.title,
+        req.raw_text,
+        req.area,
+        req.tipo,
+        req.estado,
+        req.prioridad,
+        req.fecha,
+        req.hora_inicio,
+        req.duracion,
+        req.hora_fin,
+        req.resumen,
+        req.acciones,
+        status.value,
+        req.google_event_id,
+        req.google_calendar_link,
+        req.google_calendar_id,
+    )
+
+
+def _now_iso(offset_seconds: int = 0) -> str:
+    """Return current UTC time (plus an optional offset) as a seconds-precision ISO string."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(time.time() + offset_seconds))
+
+
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Return a cursor yielding plain tuples instead of ``sqlite3.Row``."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
 
 class NoteRepository:
     """Data access for notes table."""
@@ -16,49 +66,56 @@ class NoteRepository:
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
 
-    def create_note(self, req: NoteCreateRequest, source_id: str, created_at: str, status: NoteStatus) -> int:
+    def create_note(self, req: NoteCreateRequest, source_id: str, created_at: str, status: NoteStatus) -> int | None:
+        """Insert the note and return its id, or None if ``source_id`` is already stored."""
         cursor = self.conn.execute(
-            """
-            INSERT INTO notes_local (
-                created_at, source, source_id, title, raw_text, area, tipo, estado, prioridad, fecha, hora_inicio, duracion, hora_fin, resumen, acciones, status, google_event_id, google_calendar_link, google_calendar_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                created_at,
-                req.source,
-                source_id,
-                req.title,
-                req.raw_text,
-                req.area,
-                req.tipo,
-                req.estado,
-                req.prioridad,
-                req.fecha,
-                req.hora_inicio,
-                req.duracion,
-                req.hora_fin,
-                req.resumen,
-                req.acciones,
-                status.value,
-                req.google_event_id,
-                req.google_calendar_link,
-                req.google_calendar_id,
-            ),
+            _INSERT_NOTE_SQL + " RETURNING id",
+            _note_insert_row(req, source_id, created_at, status),
         )
+        row = cursor.fetchone()
         self.conn.commit()
-        return int(cursor.lastrowid)
+        return int(row[0]) if row else None
+
+    def create_notes(
+        self,
+        items: Iterable[tuple[NoteCreateRequest, str]],
+        created_at: str,
+        status: NoteStatus,
+    ) -> dict[str, int]:
+        """Insert several ``(request, source_id)`` pairs in one statement and commit.
+
+        Source ids already stored are skipped. Returns ``{source_id: id}`` for every pair given.
+        """
+        rows = [_note_insert_row(req, source_id, created_at, status) for req, source_id in items]
+        if not rows:
+            return {}
+        self.conn.executemany(_INSERT_NOTE_SQL, rows)
+        self.conn.commit()
+        source_ids = [row[2] for row in rows]
+        placeholders = ", ".join("?" for _ in source_ids)
+        found = _tuple_cursor(self.conn).execute(
+            f"SELECT source_id, id FROM notes_local WHERE source_id IN ({placeholders})",
+            source_ids,
+        ).fetchall()
+        return {str(source_id): int(note_id) for source_id, note_id in found}
 
     def source_exists(self, source_id: str) -> bool:
         row = self.conn.execute("SELECT 1 FROM notes_local WHERE source_id = ?", (source_id,)).fetchone()
         return row is not None
 
-    def list_notes(self, limit: int = 200) -> list[Note]:
-        rows = self.conn.execute("SELECT * FROM notes_local ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
-        return [self._to_note(r) for r in rows]
+    def list_notes(self, limit: int = 200, offset: int = 0) -> list[Note]:
+        rows = _tuple_cursor(self.conn).execute(
+            f"SELECT {_NOTE_COLUMNS} FROM notes_local ORDER BY id DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        ).fetchall()
+        return [Note(*r) for r in rows]
 
     def get_note(self, note_id: int) -> Optional[Note]:
-        row = self.conn.execute("SELECT * FROM notes_local WHERE id = ?", (note_id,)).fetchone()
-        return self._to_note(row) if row else None
+        # id es la clave primaria (rowid): búsqueda directa, sin recorrer la tabla.
+        row = _tuple_cursor(self.conn).execute(
+            f"SELECT {_NOTE_COLUMNS} FROM notes_local WHERE id = ?", (note_id,)
+        ).fetchone()
+        return Note(*row) if row else None
 
     def get_note_by_source(self, source: str, source_id: str) -> Optional[Note]:
         row = self.conn.execute(
@@ -136,7 +193,6 @@ class NoteRepository:
 
     def mark_error(self, note_id: int, error_msg: str, retry_after_seconds: int) -> None:
         attempts = self.conn.execute("SELECT attempts FROM notes_local WHERE id = ?", (note_id,)).fetchone()["attempts"]
-        next_retry = datetime.utcnow() + timedelta(seconds=retry_after_seconds)
         self.conn.execute(
             """
             UPDATE notes_local
@@ -147,7 +203,7 @@ class NoteRepository:
                 NoteStatus.ERROR.value,
                 error_msg[:1000],
                 attempts + 1,
-                next_retry.isoformat(timespec="seconds"),
+                _now_iso(retry_after_seconds),
                 note_id,
             ),
         )
@@ -159,32 +215,60 @@ class NoteRepository:
 
 
 class SettingsRepository:
-    """Persist and load app settings as key-value pairs."""
+    """Persist and load app settings as key-value pairs.
+
+    The table is read once and kept in memory; every write goes through this class,
+    updates the copy and bumps ``_version`` so the cached ``AppSettings`` is rebuilt.
+    Writes committed through another connection are only seen after ``reload()``.
+    """
 
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
+        self._cache: dict[str, str] | None = None
+        self._version = 0
+        self._settings_cache: tuple[int, AppSettings] | None = None
 
-    def get_setting(self, key: str) -> Optional[str]:
-        row = self.conn.execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
-        return str(row["value"]) if row else None
+    def _values(self) -> dict[str, str]:
+        if self._cache is None:
+            rows = self.conn.execute("SELECT key, value FROM settings").fetchall()
+            self._cache = {str(r["key"]): str(r["value"]) for r in rows}
+        return self._cache
 
-    def set_setting(self, key: str, value: str) -> None:
+    def _store(self, key: str, value: str) -> None:
         self.conn.execute(
             "INSERT INTO settings(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
             (key, value),
         )
+        if self._cache is not None:
+            self._cache[key] = value
+
+    def reload(self) -> None:
+        """Drop the in-memory copy so the next read goes back to SQLite."""
+        self._cache = None
+        self._version += 1
+
+    def get_setting(self, key: str) -> Optional[str]:
+        return self._values().get(key)
+
+    def set_setting(self, key: str, value: str) -> None:
+        self._store(key, value)
         self.conn.commit()
+        self._version += 1
 
     def load(self) -> AppSettings:
-        rows = self.conn.execute("SELECT key, value FROM settings").fetchall()
-        values = {r["key"]: r["value"] for r in rows}
-        base = AppSettings()
-        for field_name in base.__dataclass_fields__.keys():
-            if field_name in values:
-                raw_value = values[field_name]
-                default_value = getattr(base, field_name)
-                setattr(base, field_name, self._cast_value(raw_value, default_value))
-        return base
+        cached = self._settings_cache
+        if cached is None or cached[0] != self._version:
+            values = self._values()
+            base = AppSettings()
+            for field_name in base.__dataclass_fields__.keys():
+                if field_name in values:
+                    raw_value = values[field_name]
+                    default_value = getattr(base, field_name)
+                    setattr(base, field_name, self._cast_value(raw_value, default_value))
+            cached = (self._version, base)
+            self._settings_cache = cached
+        # Copia: quien la reciba puede modificarla sin tocar la caché.
+        return replace(cached[1])
 
     def save(self, settings: AppSettings) -> None:
         for f in fields(settings):
@@ -194,11 +278,9 @@ class SettingsRepository:
                 stored_value = "1" if value else "0"
             else:
                 stored_value = str(value)
-            self.conn.execute(
-                "INSERT INTO settings(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                (key, stored_value),
-            )
+            self._store(key, stored_value)
         self.conn.commit()
+        self._version += 1
 
     @staticmethod
     def _cast_value(raw_value: object, default_value: object) -> object:
@@ -220,51 +302,52 @@ class ActionsRepository:
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
 
-    def create_action(self, note_id: int, description: str, area: str) -> int:
+    def create_action(self, note_id: int, description: str, area: str, created_at: Optional[str] = None) -> int:
+        """Insert a pending action; batch callers may pass a shared ``created_at``."""
         cursor = self.conn.execute(
             """
             INSERT INTO actions (note_id, description, area, status, created_at)
             VALUES (?, ?, ?, 'pendiente', ?)
             """,
-            (note_id, description, area, datetime.utcnow().isoformat(timespec="seconds")),
+            (note_id, description, area, created_at or _now_iso()),
         )
         self.conn.commit()
         return int(cursor.lastrowid)
 
     def get_pending_actions(self) -> list[Action]:
-        rows = self.conn.execute(
-            """
-            SELECT a.*
+        rows = _tuple_cursor(self.conn).execute(
+            f"""
+            SELECT {_ACTION_COLUMNS}
             FROM actions a
             WHERE a.status = 'pendiente'
             ORDER BY a.id DESC
             """
         ).fetchall()
-        return [self._to_action(r) for r in rows]
+        return [Action(*r) for r in rows]
 
     def list_actions(self, limit: int = 2000) -> list[Action]:
-        rows = self.conn.execute(
-            """
-            SELECT a.*
+        rows = _tuple_cursor(self.conn).execute(
+            f"""
+            SELECT {_ACTION_COLUMNS}
             FROM actions a
             ORDER BY a.id DESC
             LIMIT ?
             """,
             (limit,),
         ).fetchall()
-        return [self._to_action(r) for r in rows]
+        return [Action(*r) for r in rows]
 
     def get_actions_by_area(self, area: str) -> list[Action]:
-        rows = self.conn.execute(
-            """
-            SELECT a.*
+        rows = _tuple_cursor(self.conn).execute(
+            f"""
+            SELECT {_ACTION_COLUMNS}
             FROM actions a
             WHERE a.area = ?
             ORDER BY a.id DESC
             """,
             (area,),
         ).fetchall()
-        return [self._to_action(r) for r in rows]
+        return [Action(*r) for r in rows]
 
     def get_action(self, action_id: int) -> Optional[Action]:
         row = self.conn.execute(
@@ -282,7 +365,7 @@ class ActionsRepository:
 
     def set_action_status(self, action_id: int, status: str) -> None:
         normalized = "hecha" if (status or "").strip().lower() == "hecha" else "pendiente"
-        completed_at = datetime.utcnow().isoformat(timespec="seconds") if normalized == "hecha" else None
+        completed_at = _now_iso() if normalized == "hecha" else None
         self.conn.execute(
             """
             UPDATE actions
@@ -341,16 +424,16 @@ class ActionsRepository:
         return self.pending_count_by_note(note_id)
 
     def get_actions_by_note(self, note_id: int) -> list[Action]:
-        rows = self.conn.execute(
-            """
-            SELECT a.*
+        rows = _tuple_cursor(self.conn).execute(
+            f"""
+            SELECT {_ACTION_COLUMNS}
             FROM actions a
             WHERE a.note_id = ?
             ORDER BY a.id DESC
             """,
             (note_id,),
         ).fetchall()
-        return [self._to_action(r) for r in rows]
+        return [Action(*r) for r in rows]
 
     @staticmethod
     def _to_action(row: sqlite3.Row) -> Action:
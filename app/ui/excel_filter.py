@@ -12,6 +12,8 @@ from app.ui.app_icons import apply_app_icon
 
 EMPTY_LABEL = "(Vacías)"
 _TYPE_PRIORITY = {"bool": 4, "date": 3, "number": 2, "text": 1}
+_SEARCH_DEBOUNCE_MS = 150
+_EMPTY_LABEL_LOWER = EMPTY_LABEL.lower()
 
 
 @dataclass
@@ -45,10 +47,18 @@ class ExcelTreeFilter:
         get_rows: Callable[[], list[Any]],
         set_rows: Callable[[list[Any]], None],
         column_titles: Optional[dict[str, str]] = None,
+        cache_rows: bool = False,
     ) -> None:
+        """Bind the filter to ``tree``.
+
+        Pass ``cache_rows=True`` when ``get_rows`` returns the same list object
+        until its rows change and rows are never mutated in place; normalized
+        cell values are then reused across ``apply()`` calls.
+        """
         self.master = master
         self.tree = tree
         self.columns = tuple(columns)
+        self._col_index = {col: idx for idx, col in enumerate(self.columns)}
         self.get_rows = get_rows
         self.set_rows = set_rows
         self.column_titles = column_titles or {}
@@ -59,6 +69,10 @@ class ExcelTreeFilter:
         self.column_types: dict[str, str] = {c: "text" for c in self.columns}
         self._popup: Optional[tk.Toplevel] = None
         self._mode_by_col: dict[str, str] = {}
+        self.cache_rows = cache_rows
+        self._cells_rows: Optional[list[Any]] = None
+        self._cells_by_col: dict[str, list[tuple[Any, str, str]]] = {}
+        self._header_titles: dict[str, str] = {}
 
         self.tree.bind("<Button-3>", self._on_tree_right_click, add="+")
         for col in self.columns:
@@ -154,55 +168,87 @@ class ExcelTreeFilter:
         search_entry.grid(sticky="ew", pady=(0, 4))
 
         state = self.filters.get(col)
-        values_vars: dict[str, tk.BooleanVar] = {}
         select_all_var = tk.BooleanVar(value=True)
+        # Unique values are computed once per popup; search and accept reuse them.
+        all_values = self._unique_values_for_column(col)
+        selected: set[str] = set(all_values) if not state or state.selected_values is None else set(state.selected_values)
+        visible: list[str] = []
 
         def available_values() -> list[str]:
-            vals = self._unique_values_for_column(col)
+            vals = all_values
             term = search_var.get().strip().lower()
             if not term:
                 return vals
             return [v for v in vals if term in v.lower()]
 
-        def ensure_vars(vals: list[str]) -> None:
-            for v in vals:
-                if v in values_vars:
-                    continue
-                default = True if not state or state.selected_values is None else v in state.selected_values
-                values_vars[v] = tk.BooleanVar(value=default)
+        def render_values() -> None:
+            visible[:] = available_values()
+            listbox.delete(0, "end")
+            if visible:
+                listbox.insert("end", *visible)
+            for idx, val in enumerate(visible):
+                if val in selected:
+                    listbox.selection_set(idx)
+
+        def on_listbox_select(_event: tk.Event) -> None:
+            current_idx = set(listbox.curselection())
+            for idx, val in enumerate(visible):
+                if idx in current_idx:
+                    selected.add(val)
+                else:
+                    selected.discard(val)
 
         def on_select_all() -> None:
-            for v in available_values():
-                values_vars[v].set(select_all_var.get())
+            if select_all_var.get():
+                selected.update(visible)
+                listbox.selection_set(0, "end")
+            else:
+                selected.difference_update(visible)
+                listbox.selection_clear(0, "end")
+
+        def mark_search_results() -> None:
+            flush_search()
+            self._mark_search_results(visible, selected)
+            listbox.selection_set(0, "end")
 
         ttk.Checkbutton(wrap, text="Seleccionar todo", variable=select_all_var, command=on_select_all).grid(sticky="w")
-        ttk.Button(wrap, text="Seleccionar resultados de la búsqueda", command=lambda: self._mark_search_results(available_values(), values_vars)).grid(sticky="w", pady=(2, 4))
+        ttk.Button(wrap, text="Seleccionar resultados de la búsqueda", command=mark_search_results).grid(sticky="w", pady=(2, 4))
 
         list_frame = ttk.Frame(wrap)
         list_frame.grid(sticky="nsew")
-        canvas = tk.Canvas(list_frame, height=170, highlightthickness=0)
-        sb = ttk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=sb.set)
+        # A single Listbox only draws the visible viewport, unlike one Checkbutton per value.
+        listbox = tk.Listbox(list_frame, selectmode="multiple", height=10, exportselection=False, activestyle="none")
+        sb = ttk.Scrollbar(list_frame, orient="vertical", command=listbox.yview)
+        listbox.configure(yscrollcommand=sb.set)
         sb.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        inner = ttk.Frame(canvas)
-        inner_id = canvas.create_window((0, 0), window=inner, anchor="nw")
-
-        def sync_scroll(*_args: Any) -> None:
-            canvas.configure(scrollregion=canvas.bbox("all"))
-
-        inner.bind("<Configure>", sync_scroll)
-        canvas.bind("<Configure>", lambda e: canvas.itemconfigure(inner_id, width=e.width))
-
-        def render_values() -> None:
-            for widget in inner.winfo_children():
-                widget.destroy()
-            vals = available_values()
-            ensure_vars(vals)
-            for val in vals:
-                ttk.Checkbutton(inner, text=val, variable=values_vars[val]).pack(anchor="w")
-
-        search_var.trace_add("write", lambda *_: render_values())
+        listbox.pack(side="left", fill="both", expand=True)
+        listbox.bind("<<ListboxSelect>>", on_listbox_select)
+
+        # Typing in the search box is debounced so bursts of keystrokes re-filter once.
+        search_after_id: Optional[str] = None
+
+        def schedule_search(*_args: Any) -> None:
+            nonlocal search_after_id
+            if search_after_id is not None:
+                popup.after_cancel(search_after_id)
+            search_after_id = popup.after(_SEARCH_DEBOUNCE_MS, flush_search)
+
+        def flush_search(*_args: Any) -> None:
+            nonlocal search_after_id
+            if search_after_id is not None:
+                popup.after_cancel(search_after_id)
+                search_after_id = None
+                render_values()
+
+        def cancel_search(event: tk.Event) -> None:
+            nonlocal search_after_id
+            if event.widget is popup and search_after_id is not None:
+                popup.after_cancel(search_after_id)
+                search_after_id = None
+
+        search_var.trace_add("write", schedule_search)
+        search_entry.bind("<Return>", flush_search)
+        popup.bind("<Destroy>", cancel_search, add="+")
         render_values()
 
         def update_condition_visibility(*_args: Any) -> None:
@@ -228,12 +274,10 @@ class ExcelTreeFilter:
         def accept() -> None:
             self._mode_by_col[col] = mode_var.get()
             if mode_var.get() == "list":
-                all_vals = set(self._unique_values_for_column(col))
-                selected = {v for v, var in values_vars.items() if var.get()}
-                if selected == all_vals:
+                if selected == set(all_values):
                     self.filters.pop(col, None)
                 else:
-                    self.filters[col] = FilterState(selected_values=selected)
+                    self.filters[col] = FilterState(selected_values=set(selected))
             else:
                 op = operator_var.get()
                 if typ == "bool":
@@ -262,111 +306,161 @@ class ExcelTreeFilter:
 
     def apply(self) -> None:
         self._refresh_column_types()
-        rows = list(self.get_rows())
-        rows = [r for r in rows if self._row_matches_all_filters(r)]
-        rows = self._apply_sort(rows)
-        self.set_rows(rows)
+        rows = self.get_rows()
+        indices = self._apply_sort(rows, self._matching_indices(rows))
+        self.set_rows([rows[i] for i in indices])
         self._update_headers()
 
     def _row_value(self, row: Any, col: str) -> Any:
-        idx = self.columns.index(col)
         if isinstance(row, dict):
             return row.get(col)
-        return row[idx]
-
-    def _row_matches_all_filters(self, row: Any, skip_col: Optional[str] = None) -> bool:
+        return row[self._col_index[col]]
+
+    def _column_cells(self, rows: list[Any], col: str) -> list[tuple[Any, str, str]]:
+        """Return ``(normalized, display, lowered)`` per row of ``rows`` for ``col``."""
+        if rows is not self._cells_rows:
+            self._cells_rows = rows
+            self._cells_by_col = {}
+        cells = self._cells_by_col.get(col)
+        if cells is None:
+            cells = []
+            for row in rows:
+                norm = self._normalize_value(self._row_value(row, col))
+                if norm is None:
+                    cells.append((None, EMPTY_LABEL, ""))
+                else:
+                    cells.append((norm, norm, norm.lower()))
+            self._cells_by_col[col] = cells
+        return cells
+
+    def _matching_indices(self, rows: list[Any], skip_col: Optional[str] = None) -> list[int]:
+        if not self.cache_rows:
+            self._cells_rows = None
+        active = []
         for col, state in self.filters.items():
-            if skip_col == col:
+            if col == skip_col:
                 continue
-            if not self._row_matches_filter(row, col, state):
-                return False
-        return True
-
-    def _row_matches_filter(self, row: Any, col: str, state: FilterState) -> bool:
+            predicate = self._compile_filter(col, state)
+            if predicate is not None:
+                active.append((self._column_cells(rows, col), predicate))
+        if not active:
+            return list(range(len(rows)))
+        if len(active) == 1:
+            cells, predicate = active[0]
+            return [i for i, cell in enumerate(cells) if predicate(cell)]
+        return [i for i in range(len(rows)) if all(predicate(cells[i]) for cells, predicate in active)]
+
+    def _compile_filter(self, col: str, state: FilterState) -> Optional[Callable[[tuple[Any, str, str]], bool]]:
+        """Build a predicate over ``(normalized, display, lowered)`` cells for ``state``.
+
+        Operands are parsed once here instead of once per row. Returns ``None``
+        when the filter accepts every row.
+        """
         typ = self.column_types.get(col, "text")
-        raw = self._row_value(row, col)
-        norm = self._normalize_value(raw)
-        display = self._display_value(raw)
 
         if state.selected_values is not None:
-            return display in state.selected_values
+            selected = state.selected_values
+            return lambda cell: cell[1] in selected
 
         if not state.operator:
-            return True
+            return None
 
         op = state.operator
-        parsed = self._parse_typed(norm, typ)
-        p1 = self._parse_typed(state.value1, typ)
-        p2 = self._parse_typed(state.value2, typ)
-
         if op == "vacías":
-            return norm is None
+            return lambda cell: cell[0] is None
         if op == "no vacías":
-            return norm is not None
+            return lambda cell: cell[0] is not None
         if typ == "bool":
-            return parsed == self._to_bool(state.value1)
-        if parsed is None:
-            return False
+            target = self._to_bool(state.value1)
+            return lambda cell: self._parse_typed(cell[0], typ) == target
+
+        p1 = self._parse_typed(state.value1, typ)
+        p2 = self._parse_typed(state.value2, typ)
+
         if op in {"contiene", "no contiene", "empieza por", "termina en", "igual a", "distinto de"}:
-            left = str(parsed).lower()
             right = str(p1 or "").lower()
-            if op == "contiene":
-                return right in left
-            if op == "no contiene":
-                return right not in left
-            if op == "empieza por":
-                return left.startswith(right)
-            if op == "termina en":
-                return left.endswith(right)
-            if op == "igual a":
-                return left == right
-            return left != right
-        if op == "=":
-            return parsed == p1
-        if op == "≠":
-            return parsed != p1
-        if op == ">":
-            return p1 is not None and parsed > p1
-        if op == "<":
-            return p1 is not None and parsed < p1
-        if op == "≥":
-            return p1 is not None and parsed >= p1
-        if op == "≤":
-            return p1 is not None and parsed <= p1
-        if op == "entre":
-            return p1 is not None and p2 is not None and p1 <= parsed <= p2
-        if op == "es":
-            return parsed == p1
-        if op == "antes de":
-            return p1 is not None and parsed < p1
-        if op == "después de":
-            return p1 is not None and parsed > p1
-        if op == "hoy":
-            return parsed == date.today()
-        if op == "este mes" and isinstance(parsed, date):
-            now = date.today()
-            return parsed.year == now.year and parsed.month == now.month
-        return True
-
-    def _apply_sort(self, rows: list[Any]) -> list[Any]:
+            if typ == "text":
+                def left_of(cell: tuple[Any, str, str]) -> Optional[str]:
+                    return None if cell[0] is None else cell[2]
+            else:
+                def left_of(cell: tuple[Any, str, str]) -> Optional[str]:
+                    parsed = self._parse_typed(cell[0], typ)
+                    return None if parsed is None else str(parsed).lower()
+
+            text_ops: dict[str, Callable[[str], bool]] = {
+                "contiene": lambda left: right in left,
+                "no contiene": lambda left: right not in left,
+                "empieza por": lambda left: left.startswith(right),
+                "termina en": lambda left: left.endswith(right),
+                "igual a": lambda left: left == right,
+                "distinto de": lambda left: left != right,
+            }
+            text_op = text_ops[op]
+
+            def match_text(cell: tuple[Any, str, str]) -> bool:
+                left = left_of(cell)
+                return left is not None and text_op(left)
+
+            return match_text
+
+        today = date.today()
+
+        def match_typed(cell: tuple[Any, str, str]) -> bool:
+            parsed = self._parse_typed(cell[0], typ)
+            if parsed is None:
+                return False
+            if op == "=":
+                return parsed == p1
+            if op == "≠":
+                return parsed != p1
+            if op == ">":
+                return p1 is not None and parsed > p1
+            if op == "<":
+                return p1 is not None and parsed < p1
+            if op == "≥":
+                return p1 is not None and parsed >= p1
+            if op == "≤":
+                return p1 is not None and parsed <= p1
+            if op == "entre":
+                return p1 is not None and p2 is not None and p1 <= parsed <= p2
+            if op == "es":
+                return parsed == p1
+            if op == "antes de":
+                return p1 is not None and parsed < p1
+            if op == "después de":
+                return p1 is not None and parsed > p1
+            if op == "hoy":
+                return parsed == today
+            if op == "este mes" and isinstance(parsed, date):
+                return parsed.year == today.year and parsed.month == today.month
+            return True
+
+        return match_typed
+
+    def _apply_sort(self, rows: list[Any], indices: list[int]) -> list[int]:
+        """Return ``indices`` (positions in ``rows``) in the current sort order."""
         if not self.sort_column:
-            return rows
+            return indices
         col = self.sort_column
         typ = self.column_types.get(col, "text")
         reverse = self.sort_direction == "desc"
-
-        def key_fn(row: Any) -> tuple[int, Any]:
-            parsed = self._parse_typed(self._row_value(row, col), typ)
-            return (1, None) if parsed is None else (0, parsed)
-
-        return sorted(rows, key=key_fn, reverse=reverse)
+        cells = self._column_cells(rows, col)
+        if typ == "text":
+            # El valor normalizado ya es el texto a comparar.
+            keys = {i: cells[i][0] for i in indices}
+        else:
+            keys = {i: self._parse_typed(cells[i][0], typ) for i in indices}
+        filled = [i for i in indices if keys[i] is not None]
+        empty = [i for i in indices if keys[i] is None]
+        filled.sort(key=keys.__getitem__, reverse=reverse)
+        # Las vacías van al final en orden ascendente y al principio en descendente.
+        return empty + filled if reverse else filled + empty
 
     def _unique_values_for_column(self, col: str) -> list[str]:
-        values: set[str] = set()
-        for row in self.get_rows():
-            if not self._row_matches_all_filters(row, skip_col=col):
-                continue
-            values.add(self._display_value(self._row_value(row, col)))
+        rows = self.get_rows()
+        indices = self._matching_indices(rows, skip_col=col)
+        cells = self._column_cells(rows, col)
+        values: set[str] = {cells[i][1] for i in indices}
         current = self.filters.get(col)
         if current and current.selected_values:
             values.update(current.selected_values)
@@ -410,7 +504,7 @@ class ExcelTreeFilter:
         if value is None:
             return None
         text = str(value).strip()
-        if text == "" or text.lower() == EMPTY_LABEL.lower():
+        if text == "" or text.lower() == _EMPTY_LABEL_LOWER:
             return None
         return text
 
@@ -457,11 +551,13 @@ class ExcelTreeFilter:
                 title = f"■ {title}"
             if self.sort_column == col:
                 title += " ▲" if self.sort_direction == "asc" else " ▼"
-            self.tree.heading(col, text=title, command=lambda c=col: self.toggle_sort(c))
+            # Los comandos de cabecera se enlazan una sola vez en __init__.
+            if self._header_titles.get(col) != title:
+                self.tree.heading(col, text=title)
+                self._header_titles[col] = title
 
-    def _mark_search_results(self, vals: list[str], values_vars: dict[str, tk.BooleanVar]) -> None:
-        for val in vals:
-            values_vars[val].set(True)
+    def _mark_search_results(self, vals: list[str], selected: set[str]) -> None:
+        selected.update(vals)
 
     def _sort_from_popup(self, col: str, direction: str) -> None:
         self.set_sort(col, direction)
@@ -5,15 +5,17 @@ from __future__ import annotations
 import logging
 import queue
 import sqlite3
-import threading
 import tkinter as tk
 import webbrowser
 import importlib
 import importlib.util
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from queue import Queue
 from tkinter import filedialog, messagebox, ttk
+from typing import Any, Callable, Sequence
 
 from tkcalendar import DateEntry
 
@@ -22,7 +24,7 @@ from app.core.calendar.google_calendar_client import (
     GoogleCalendarClient,
     crear_evento_google_calendar,
 )
-from app.core.models import AppSettings, NoteCreateRequest
+from app.core.models import Action, AppSettings, Note, NoteCreateRequest
 from app.core.service import NOTION_DISABLED_MESSAGE, NoteService
 from app.core.email.gmail_client import GmailClient
 from app.core.email.mail_ingestion_service import MailIngestionService
@@ -38,6 +40,7 @@ from app.services.mobile_notes_import_service import MobileNotesImportService
 from app.persistence.knowledge_repository import KnowledgeRepository
 from app.ui.excel_filter import ExcelTreeFilter
 from app.ui.masters_dialog import MastersDialog
+from app.ui.treeview_batch import insert_tree_rows
 from app.ui.email_manager_window import EmailManagerWindow
 from app.ui.calendar_manager_window import CalendarManagerWindow
 from app.ui.ml_manager_window import MLManagerWindow
@@ -53,6 +56,16 @@ from app.ui.dictation_widgets import attach_dictation
 
 logger = logging.getLogger(__name__)
 _WIN_TOASTER = None
+_POLL_INTERVAL_MS = 150
+_POLL_MIN_INTERVAL_MS = 20
+_POLL_MAX_INTERVAL_MS = 1000
+_TREE_FIRST_PAGE_ROWS = 200
+_TREE_CHUNK_ROWS = 50
+_TOAST_DURATION_MS = 3000
+_FORM_MASTER_CATEGORIES = ("Area", "Tipo", "Estado", "Prioridad")
+# Texto de los combos de maestros mientras se leen en segundo plano.
+_MASTERS_LOADING = "Cargando…"
+_NOTES_PAGE_SIZE = 200
 
 
 def _resolve_notification_sender():
@@ -107,6 +120,108 @@ def duracion_desde_etiqueta(etiqueta: str) -> int:
         return 60
 
 
+def _read_string_vars(widget: tk.Misc, variables: Sequence[tk.Variable]) -> tuple[str, ...]:
+    """Read several Tk variables with a single Tcl evaluation."""
+    script = "list " + " ".join(f"${{::{variable}}}" for variable in variables)
+    return tuple(str(value) for value in widget.tk.splitlist(widget.tk.eval(script)))
+
+
+def _notion_page_url(notion_page_id: str) -> str:
+    return f"https://www.notion.so/{notion_page_id.replace('-', '')}"
+
+
+def _drain_queue(source: queue.Queue) -> list:
+    """Take every pending item from ``source`` with a single lock acquisition."""
+    with source.mutex:
+        items = list(source.queue)
+        source.queue.clear()
+        source.not_full.notify_all()
+    return items
+
+
+def _move_out_of_place(tree: ttk.Treeview, current: list[str], order: list[str]) -> None:
+    """Reorder the attached ``current`` iids into ``order`` moving as few items as possible.
+
+    Items already in the right relative order (the longest increasing subsequence of their
+    current positions) stay put; iids missing from ``current`` are reattached.
+    """
+    position = {iid: index for index, iid in enumerate(current)}
+    positions = [position.get(iid, -1) for iid in order]
+    # Subsecuencia creciente más larga (patience sorting) sobre las posiciones actuales.
+    tails: list[int] = []
+    tails_at: list[int] = []
+    parent = [-1] * len(order)
+    for index, pos in enumerate(positions):
+        if pos < 0:
+            continue
+        slot = bisect_left(tails, pos)
+        parent[index] = tails_at[slot - 1] if slot else -1
+        if slot == len(tails):
+            tails.append(pos)
+            tails_at.append(index)
+        else:
+            tails[slot] = pos
+            tails_at[slot] = index
+    stable: set[int] = set()
+    index = tails_at[-1] if tails_at else -1
+    while index >= 0:
+        stable.add(index)
+        index = parent[index]
+    last_stable = max((positions[index] for index in stable), default=-1)
+    movers = [index for index in range(len(order)) if index not in stable]
+    # Las filas a mover que quedan delante de una fija se sueltan antes para no desplazar los índices.
+    blocking = [order[index] for index in movers if 0 <= positions[index] < last_stable]
+    if blocking:
+        tree.detach(*blocking)
+    for index in movers:
+        tree.move(order[index], "", index)
+
+
+def _sync_tree_rows(
+    tree: ttk.Treeview,
+    rows: list[tuple],
+    iid_prefix: str,
+    rendered: dict[str, tuple],
+    all_rows: list[tuple] | None = None,
+    visible: list[str] | None = None,
+) -> None:
+    """Make ``tree`` show ``rows`` in order, touching only items that changed.
+
+    ``rendered`` maps iid -> values for every item in the tree, attached or
+    detached, and is updated in place. Items whose row is still in ``all_rows``
+    but filtered out of ``rows`` are detached rather than deleted, so showing
+    them again is a cheap reattach. When given, ``visible`` tracks the attached
+    iids in order so an unchanged view costs no Tk calls at all.
+    """
+    new_values = {f"{iid_prefix}{row[0]}": row for row in rows}
+    keep = new_values if all_rows is None else {f"{iid_prefix}{row[0]}" for row in all_rows}
+    attached = list(tree.get_children()) if visible is None else list(visible)
+    removed = [iid for iid in rendered if iid not in keep and iid not in new_values]
+    if removed:
+        tree.delete(*removed)
+        for iid in removed:
+            del rendered[iid]
+    hidden = [iid for iid in attached if iid not in new_values and iid in rendered]
+    if hidden:
+        tree.detach(*hidden)
+    inserted: list[str] = []
+    for iid, values in new_values.items():
+        previous = rendered.get(iid)
+        if previous is None:
+            inserted.append(iid)
+        elif previous != values:
+            tree.item(iid, values=values)
+        rendered[iid] = values
+    # Todas las altas viajan a Tcl en un único script.
+    insert_tree_rows(tree, ((iid, new_values[iid]) for iid in inserted))
+    order = list(new_values)
+    current = [iid for iid in attached if iid in new_values] + inserted
+    if current != order:
+        _move_out_of_place(tree, current, order)
+    if visible is not None:
+        visible[:] = order
+
+
 class MainWindow(ttk.Frame):
     """Primary app UI with note form and sync status list."""
 
@@ -117,6 +232,7 @@ class MainWindow(ttk.Frame):
         db_connection: sqlite3.Connection | None = None,
         gmail_credentials_path: str = GMAIL_CREDENTIALS,
         gmail_token_path: str = GMAIL_TOKEN,
+        service_factory: Callable[[], NoteService] | None = None,
     ):
         super().__init__(master, padding=10)
         self.master = master
@@ -135,7 +251,21 @@ class MainWindow(ttk.Frame):
         self._calendar_client: GoogleCalendarClient | None = None
         self.calendar_repo = CalendarRepository(db_connection) if db_connection is not None else None
         self.calendar_name_to_id: dict[str, str] = {}
-        self.msg_queue: queue.Queue[tuple[str, str]] = queue.Queue()
+        self.msg_queue: queue.Queue[tuple[str, Any]] = queue.Queue()
+        self._poll_interval_ms = _POLL_INTERVAL_MS
+        self._poll_after_id: str | None = None
+        # Dos hilos de fondo: uno lee notas, acciones y maestros y otro habla con Notion, así las
+        # recargas no esperan a una sincronización larga. Con service_factory cada hilo abre su
+        # propio servicio (y su propia conexión SQLite) y el hilo de Tk sigue usando self.service;
+        # sin ella (ventana incrustada en pruebas) los tres comparten self.service.
+        self._service_factory = service_factory
+        self._reader_service = service
+        self._notion_service = service
+        self._executor = self._build_executor("nsb-read", "_reader_service")
+        self._notion_executor = self._build_executor("nsb-notion", "_notion_service")
+        self._sync_future: Future | None = None
+        # Cada recarga completa lleva un número; los resultados de recargas anteriores se descartan.
+        self._load_generation = 0
         self.email_queue: Queue[list[dict[str, str]]] = Queue()
         self.seen_email_ids: set[str] = set()
         self.email_checker_thread: EmailCheckerThread | None = None
@@ -158,6 +288,32 @@ class MainWindow(ttk.Frame):
             "error": "Error",
             "notion_page_id": "Notion ID",
         }
+        # Últimas lecturas recibidas del hilo de fondo; None hasta que llega la primera.
+        self._notes_cache: dict[int, Note] | None = None
+        # Las notas se piden por páginas; al llegar al final del árbol se amplía el límite.
+        self._notes_limit = _NOTES_PAGE_SIZE
+        self._notes_page_loading = False
+        # Si la última lectura llenó su límite puede haber más notas en SQLite.
+        self._notes_has_more = True
+        # Solo un desplazamiento hecho por el usuario (rueda o teclado) puede pedir otra página.
+        self._notes_user_scrolled = False
+        self._actions_cache: list[Action] | None = None
+        self._master_cache: dict[str, list[str]] | None = None
+        # Últimos valores aplicados a cada combobox (por ruta de widget) para no reconfigurarlo en balde.
+        self._combo_values: dict[str, tuple[str, ...]] = {}
+        self._notes_rendered: dict[str, tuple] = {}
+        self._note_urls: dict[int, str] = {}
+        # Últimas notas pintadas; a diferencia de _notes_cache, no se vacía al invalidar.
+        self._notes_by_id: dict[int, Note] = {}
+        # Áreas y estados se repiten en casi todas las filas: una sola copia por valor.
+        self._shared_strings: dict[str, str] = {}
+        self._actions_rendered: dict[str, tuple] = {}
+        self._notes_visible: list[str] = []
+        self._actions_visible: list[str] = []
+        self._actions_fill_after_id: str | None = None
+        # Repintados pendientes de los árboles; se agrupan en un único after_idle.
+        self._refresh_scheduled = False
+        self._refresh_targets: set[str] = set()
         self.actions_data: list[tuple[int, str, str, str, int, str]] = []
         self.filtered_actions_data: list[tuple[int, str, str, str, int, str]] = []
         self.action_columns = ("id", "area", "description", "status", "note_id", "notion_page_id")
@@ -173,13 +329,14 @@ class MainWindow(ttk.Frame):
         self._build_menu()
         self._build_form()
         self._build_sections()
-        self._load_master_values()
         self._refresh_database_button_state()
         self.sync_google_calendars()
         self._load_calendar_selector_values()
-        self.refresh_notes()
-        self.refresh_actions()
-        self.after(150, self._poll_queue)
+        # Maestros, notas y acciones se leen en segundo plano una vez arrancado
+        # el bucle de Tk, para que la ventana se pinte sin esperar a SQLite.
+        self.after_idle(self._load_masters_async)
+        self.after_idle(self._refresh_data_async)
+        self._poll_after_id = self.after(self._poll_interval_ms, self._poll_queue)
         self._initialize_background_email_checker()
         self._initialize_knowledge_background_checker()
         self.master.bind("<<KnowledgeDownloadNow>>", self._download_knowledge_now)
@@ -258,7 +415,7 @@ class MainWindow(ttk.Frame):
         self.hora_fin_var.set("")
 
     def _open_masters_dialog(self, category: str) -> None:
-        MastersDialog(self.master, self.service, category, self._load_master_values)
+        MastersDialog(self.master, self.service, category, self._on_masters_changed)
 
     def _ensure_email_manager_window(self) -> EmailManagerWindow | None:
         if self.db_connection is None:
@@ -605,10 +762,10 @@ class MainWindow(ttk.Frame):
         form.pack(fill="x", pady=5)
 
         self.source_var = tk.StringVar(value="manual")
-        self.area_var = tk.StringVar()
-        self.tipo_var = tk.StringVar()
-        self.estado_var = tk.StringVar(value="Pendiente")
-        self.prioridad_var = tk.StringVar(value="Media")
+        self.area_var = tk.StringVar(value=_MASTERS_LOADING)
+        self.tipo_var = tk.StringVar(value=_MASTERS_LOADING)
+        self.estado_var = tk.StringVar(value=_MASTERS_LOADING)
+        self.prioridad_var = tk.StringVar(value=_MASTERS_LOADING)
         self.title_var = tk.StringVar()
 
         ttk.Label(form, text="Título").grid(row=0, column=0, padx=6, pady=6, sticky="e")
@@ -763,7 +920,7 @@ class MainWindow(ttk.Frame):
         calendars = self.calendar_repo.list_calendars()
         names = [str(row["name"]) for row in calendars]
         self.calendar_name_to_id = {str(row["name"]): str(row["google_calendar_id"]) for row in calendars}
-        self.calendar_combo.configure(values=names)
+        self._set_combo_values(self.calendar_combo, names)
 
         selected_name = ""
         primary = self.calendar_repo.get_primary_calendar()
@@ -798,6 +955,9 @@ class MainWindow(ttk.Frame):
         self.tree.column("status", width=90)
         self.tree.column("error", width=260)
         self.tree.column("notion_page_id", width=220)
+        self.tree.configure(yscrollcommand=self._on_notes_yview)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>", "<Down>", "<Next>", "<End>"):
+            self.tree.bind(sequence, self._mark_notes_user_scroll, add="+")
         self.tree.pack(fill="both", expand=True)
         self.tree.bind("<Double-1>", lambda e: self._open_selected_note())
 
@@ -808,6 +968,7 @@ class MainWindow(ttk.Frame):
             column_titles=self.note_column_titles,
             get_rows=lambda: self._entry_filtered_notes_data,
             set_rows=self._set_notes_filtered_rows,
+            cache_rows=True,
         )
 
         notes_toolbar = ttk.Frame(notes_frame)
@@ -819,7 +980,7 @@ class MainWindow(ttk.Frame):
         toolbar.pack(fill="x", padx=4, pady=4)
         ttk.Button(toolbar, text="Marcar como hecha", command=self._mark_selected_action_done).pack(side="left", padx=6)
         ttk.Button(toolbar, text="Finalizar seleccionadas", command=self._mark_selected_actions_done).pack(side="left", padx=6)
-        ttk.Button(toolbar, text="Refrescar", command=self.refresh_actions).pack(side="left", padx=6)
+        ttk.Button(toolbar, text="Refrescar", command=self._refresh_data_async).pack(side="left", padx=6)
         ttk.Button(toolbar, text="Abrir", command=self._open_selected_action).pack(side="left", padx=6)
 
         self.actions_tree = ttk.Treeview(
@@ -852,35 +1013,58 @@ class MainWindow(ttk.Frame):
             column_titles=self.action_column_titles,
             get_rows=lambda: self._entry_filtered_actions_data,
             set_rows=self._set_actions_filtered_rows,
+            cache_rows=True,
         )
 
         ttk.Button(toolbar, text="Limpiar filtros", command=self.actions_excel_filter.clear_all_filters).pack(side="left", padx=6)
 
         ttk.Label(self, textvariable=self.status_var, anchor="w").pack(fill="x", pady=(2, 0))
 
+    def _on_masters_changed(self) -> None:
+        self._load_masters_async()
+
+    def _load_masters_async(self) -> None:
+        self._submit_background(self._load_masters_worker)
+
+    def _load_masters_worker(self) -> None:
+        try:
+            # La caché de maestros de este hilo no ve las ediciones hechas desde el hilo de Tk.
+            self._reader_service.invalidate_master_values()
+            masters = self._reader_service.get_master_values_bulk(list(_FORM_MASTER_CATEGORIES))
+            self._post_message("masters", masters)
+        except Exception:  # noqa: BLE001
+            logger.exception("No se pudieron cargar los maestros")
+            self._post_message("status", "Error al cargar maestros")
+
     def _load_master_values(self) -> None:
-        area_values = self.service.get_master_values("Area")
-        tipo_values = self.service.get_master_values("Tipo")
-        estado_values = self.service.get_master_values("Estado")
-        prioridad_values = self.service.get_master_values("Prioridad")
-
-        self.area_combo.configure(values=area_values)
-        self.tipo_combo["values"] = tipo_values
-        self.estado_combo.configure(values=estado_values)
-        self.prioridad_combo.configure(values=prioridad_values)
-        if area_values:
-            self.area_var.set(area_values[0])
-        if tipo_values:
-            self.tipo_var.set(tipo_values[0])
+        """Apply the masters loaded in the background, keeping any value already chosen."""
+        if self._master_cache is None:
+            return
+        for combo, var, category, preferred in (
+            (self.area_combo, self.area_var, "Area", None),
+            (self.tipo_combo, self.tipo_var, "Tipo", None),
+            (self.estado_combo, self.estado_var, "Estado", "Pendiente"),
+            (self.prioridad_combo, self.prioridad_var, "Prioridad", "Media"),
+        ):
+            values = self._master_cache[category]
+            self._set_combo_values(combo, values)
+            current = var.get()
+            if current and current != _MASTERS_LOADING:
+                continue
+            if preferred in values:
+                var.set(preferred)
+            else:
+                var.set(values[0] if values else "")
         self._toggle_event_time_fields()
-        if "Pendiente" in estado_values:
-            self.estado_var.set("Pendiente")
-        elif estado_values:
-            self.estado_var.set(estado_values[0])
-        if "Media" in prioridad_values:
-            self.prioridad_var.set("Media")
-        elif prioridad_values:
-            self.prioridad_var.set(prioridad_values[0])
+
+    def _set_combo_values(self, combo: ttk.Combobox, values: Sequence[str]) -> None:
+        """Configure ``values`` on ``combo`` only when they differ from the last ones applied."""
+        new_values = tuple(values)
+        key = str(combo)
+        if self._combo_values.get(key) == new_values:
+            return
+        combo.configure(values=new_values)
+        self._combo_values[key] = new_values
 
     def _open_settings(self, initial_tab: str = "General") -> SettingsDialog:
         current = self.service.get_settings()
@@ -986,34 +1170,51 @@ class MainWindow(ttk.Frame):
             messagebox.showwarning("Validación", "El texto de la nota es obligatorio.")
             return
 
-        tipo = self.tipo_var.get().strip() or "Nota"
-        hora_inicio = self.hora_inicio_var.get().strip() or None
-        duracion = duracion_desde_etiqueta(self.duracion_var.get()) if tipo.lower() == "evento" else None
-        hora_fin = calcular_hora_fin(hora_inicio, duracion) if tipo.lower() == "evento" and hora_inicio and duracion else None
+        title, source, area, tipo, estado, prioridad, hora_inicio, duracion_label = _read_string_vars(
+            self,
+            (
+                self.title_var,
+                self.source_var,
+                self.area_var,
+                self.tipo_var,
+                self.estado_var,
+                self.prioridad_var,
+                self.hora_inicio_var,
+                self.duracion_var,
+            ),
+        )
+        tipo = tipo.strip() or "Nota"
+        es_evento = tipo.lower() == "evento"
+        hora_inicio = hora_inicio.strip() or None
+        duracion = duracion_desde_etiqueta(duracion_label) if es_evento else None
+        hora_fin = calcular_hora_fin(hora_inicio, duracion) if es_evento and hora_inicio and duracion else None
 
-        if tipo.lower() == "evento" and hora_inicio is None:
+        if es_evento and hora_inicio is None:
             messagebox.showwarning("Validación", "Selecciona una hora de inicio para el evento.")
             return
+        if _MASTERS_LOADING in (area, tipo, estado, prioridad):
+            messagebox.showwarning("Validación", "Espera a que terminen de cargarse los maestros.")
+            return
 
         req = NoteCreateRequest(
-            title=self.title_var.get().strip(),
+            title=title.strip(),
             raw_text=raw_text,
-            source=self.source_var.get(),
-            area=self.area_var.get().strip() or "General",
+            source=source,
+            area=area.strip() or "General",
             tipo=tipo,
-            estado=self.estado_var.get().strip() or "Pendiente",
-            prioridad=self.prioridad_var.get().strip() or "Media",
+            estado=estado.strip() or "Pendiente",
+            prioridad=prioridad.strip() or "Media",
             fecha=self.date_entry.get_date().isoformat(),
             hora_inicio=hora_inicio,
             duracion=duracion,
             hora_fin=hora_fin,
-            google_calendar_id=self._selected_google_calendar_id() if tipo.lower() == "evento" else "",
+            google_calendar_id=self._selected_google_calendar_id() if es_evento else "",
         )
         note_id, msg = self.service.create_note(req)
         if note_id is None:
             messagebox.showinfo("Duplicado", msg)
         else:
-            if tipo.lower() == "evento" and hora_inicio:
+            if es_evento and hora_inicio:
                 selected_calendar_id = self._selected_google_calendar_id()
                 event_data = self._create_google_calendar_event(
                     titulo=req.title or raw_text.split("\n", 1)[0][:120] or "Sin título",
@@ -1030,14 +1231,14 @@ class MainWindow(ttk.Frame):
                         str(event_data.get("htmlLink") or ""),
                         selected_calendar_id,
                     )
-            messagebox.showinfo("OK", msg)
+            self.status_var.set(msg)
+            self._show_toast(msg)
             self.text_widget.delete("1.0", "end")
             self.title_var.set("")
             self.hora_inicio_var.set("")
             self.duracion_var.set("60 min")
             self.hora_fin_var.set("")
-        self.refresh_notes()
-        self.refresh_actions()
+        self._refresh_data_async()
         if self._calendar_window is not None and self._calendar_window.winfo_exists():
             self._calendar_window.refresh_calendar_view()
 
@@ -1148,15 +1349,20 @@ class MainWindow(ttk.Frame):
             self.status_var.set(NOTION_DISABLED_MESSAGE)
             messagebox.showinfo("Notion desactivado", NOTION_DISABLED_MESSAGE)
             return
-        threading.Thread(target=self._sync_worker, daemon=True).start()
+        if self._sync_future is not None and not self._sync_future.done():
+            self.status_var.set("Sincronización en curso...")
+            return
+        self._sync_future = self._submit_background(self._sync_worker, executor=self._notion_executor)
 
     def _sync_worker(self) -> None:
         try:
-            self.msg_queue.put(("status", "Sincronizando notas pendientes..."))
-            sent, failed = self.service.sync_pending()
-            self.msg_queue.put(("info", f"Sincronización completada. Enviadas: {sent}, Errores: {failed}"))
+            self._post_message("status", "Sincronizando notas pendientes...")
+            # Ajustes y maestros pueden haber cambiado desde el hilo de Tk desde la última vez.
+            self._notion_service.reload_caches()
+            sent, failed = self._notion_service.sync_pending()
+            self._post_message("info", f"Sincronización completada. Enviadas: {sent}, Errores: {failed}")
         except Exception as exc:  # noqa: BLE001
-            self.msg_queue.put(("error", str(exc)))
+            self._post_message("error", str(exc))
 
     def _create_notion_database(self) -> None:
         if not self.service.is_notion_enabled():
@@ -1166,40 +1372,152 @@ class MainWindow(ttk.Frame):
             return
         self.create_db_button.config(state="disabled")
         self.status_var.set("Creando base de datos en Notion...")
-        threading.Thread(target=self._create_notion_database_worker, daemon=True).start()
+        self._submit_background(self._create_notion_database_worker, executor=self._notion_executor)
 
     def _create_notion_database_worker(self) -> None:
         try:
-            database_id = self.service.create_notion_database_from_config()
-            self.msg_queue.put(("db_success", f"Base Notion lista. DATABASE_ID: {database_id}"))
+            self._notion_service.reload_caches()
+            database_id = self._notion_service.create_notion_database_from_config()
+            self._post_message("db_success", f"Base Notion lista. DATABASE_ID: {database_id}")
         except Exception as exc:  # noqa: BLE001
-            self.msg_queue.put(("db_error", str(exc)))
+            self._post_message("db_error", str(exc))
+
+    def _post_message(self, kind: str, payload: Any) -> None:
+        """Queue a message from a worker thread; only the Tk-thread poller reads it."""
+        self.msg_queue.put((kind, payload))
+
+    def _build_executor(self, name: str, service_attr: str) -> ThreadPoolExecutor:
+        """Single-thread executor whose thread opens its own service in ``service_attr``, if possible."""
+        if self._service_factory is None:
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        return ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=name,
+            initializer=self._open_worker_service,
+            initargs=(service_attr,),
+        )
+
+    def _open_worker_service(self, service_attr: str) -> None:
+        # Se ejecuta dentro del hilo de fondo: la conexión nace y se usa solo en ese hilo.
+        setattr(self, service_attr, self._service_factory())
+
+    def _submit_background(self, fn, *args, executor: ThreadPoolExecutor | None = None) -> Future:
+        """Run ``fn`` on ``executor`` (the reader by default) and poll soon for its messages.
+
+        Called from the Tk thread, so rescheduling the poller here is safe; workers never touch Tk.
+        """
+        future = (executor or self._executor).submit(fn, *args)
+        self._poll_interval_ms = _POLL_MIN_INTERVAL_MS
+        if self._poll_after_id is not None:
+            self.after_cancel(self._poll_after_id)
+        self._poll_after_id = self.after(_POLL_MIN_INTERVAL_MS, self._poll_queue)
+        return future
 
     def _poll_queue(self) -> None:
-        while True:
-            try:
-                kind, msg = self.msg_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._poll_after_id = None
+        notes_dirty = False
+        actions_dirty = False
+        reload_data = False
+        messages = _drain_queue(self.msg_queue)
+        if messages:
+            # Con actividad, volver a sondear enseguida por si llegan más mensajes.
+            self._poll_interval_ms = _POLL_MIN_INTERVAL_MS
+        else:
+            # Sin actividad, duplicar la espera hasta un máximo de 1000 ms.
+            self._poll_interval_ms = min(self._poll_interval_ms * 2, _POLL_MAX_INTERVAL_MS)
+        for kind, msg in messages:
             if kind == "error":
                 self.status_var.set(f"Error: {msg}")
-                messagebox.showerror("Error", msg)
+                self._show_toast(msg, error=True)
+                reload_data = True
             elif kind == "db_error":
                 self.status_var.set(f"Error al crear base: {msg}")
                 self.create_db_button.config(state="normal")
-                messagebox.showerror("Error", msg)
+                self._show_toast(msg, error=True)
             elif kind == "db_success":
+                # El DATABASE_ID se guardó desde la conexión del hilo de Notion.
+                self.service.reload_caches()
                 self.status_var.set("Base Notion creada correctamente")
                 self.create_db_button.config(state="disabled")
-                messagebox.showinfo("Éxito", msg)
+                self._show_toast(msg)
+                reload_data = True
             elif kind == "status":
                 self.status_var.set(msg)
+            elif kind == "masters":
+                self._master_cache = msg
+                self._load_master_values()
+            elif kind == "notes_data":
+                generation, notes, has_more = msg
+                if generation == self._load_generation:
+                    self._notes_cache = {note.id: note for note in notes}
+                    self._notes_has_more = has_more
+                    notes_dirty = True
+            elif kind == "notes_page":
+                generation, notes, has_more = msg
+                self._notes_page_loading = False
+                if generation == self._load_generation and self._notes_cache is not None:
+                    self._notes_has_more = has_more
+                    for note in notes:
+                        self._notes_cache.setdefault(note.id, note)
+                    notes_dirty = True
+            elif kind == "actions_data":
+                generation, actions = msg
+                if generation == self._load_generation:
+                    self._actions_cache = actions
+                    actions_dirty = True
             else:
                 self.status_var.set(msg)
-                messagebox.showinfo("Resultado", msg)
+                self._show_toast(msg)
+                reload_data = True
+        # Una sola repintada/recarga por ciclo, aunque lleguen varios mensajes.
+        if notes_dirty:
+            self._schedule_refresh("notes")
+        if actions_dirty:
+            self._schedule_refresh("actions")
+        if reload_data:
+            self._refresh_data_async()
+        # _submit_background puede haber programado ya el siguiente sondeo: nunca dos cadenas.
+        if self._poll_after_id is None:
+            self._poll_after_id = self.after(self._poll_interval_ms, self._poll_queue)
+
+    def _schedule_refresh(self, target: str) -> None:
+        """Repaint the notes or actions tree in the next idle slot, once per slot."""
+        self._refresh_targets.add(target)
+        if self._refresh_scheduled:
+            return
+        self._refresh_scheduled = True
+        self.after_idle(self._refresh_all)
+
+    def _refresh_all(self) -> None:
+        self._refresh_scheduled = False
+        targets, self._refresh_targets = self._refresh_targets, set()
+        if "notes" in targets:
             self.refresh_notes()
+        if "actions" in targets:
             self.refresh_actions()
-        self.after(150, self._poll_queue)
+
+    def _show_toast(self, message: str, error: bool = False) -> None:
+        """Show a non-modal notice in the bottom-right corner that closes itself."""
+        toast = tk.Toplevel(self.master)
+        toast.overrideredirect(True)
+        toast.attributes("-topmost", True)
+        label = tk.Label(
+            toast,
+            text=message,
+            bg="#7f1d1d" if error else "#1f2937",
+            fg="#ffffff",
+            padx=12,
+            pady=8,
+            wraplength=360,
+            justify="left",
+        )
+        label.pack()
+        label.bind("<Button-1>", lambda _event: toast.destroy())
+        toast.update_idletasks()
+        x = self.master.winfo_rootx() + self.master.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.master.winfo_rooty() + self.master.winfo_height() - toast.winfo_reqheight() - 40
+        toast.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+        toast.after(_TOAST_DURATION_MS, toast.destroy)
 
     def _initialize_background_email_checker(self) -> None:
         if self.db_connection is None:
@@ -1360,6 +1678,20 @@ class MainWindow(ttk.Frame):
             except tk.TclError:
                 pass
             self._email_queue_after_id = None
+        if self._actions_fill_after_id is not None:
+            try:
+                self.after_cancel(self._actions_fill_after_id)
+            except tk.TclError:
+                pass
+            self._actions_fill_after_id = None
+        if self._poll_after_id is not None:
+            try:
+                self.after_cancel(self._poll_after_id)
+            except tk.TclError:
+                pass
+            self._poll_after_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._notion_executor.shutdown(wait=False, cancel_futures=True)
         self.master.destroy()
 
     def _refresh_database_button_state(self) -> None:
@@ -1376,20 +1708,96 @@ class MainWindow(ttk.Frame):
         else:
             self.create_db_button.config(state="normal")
 
+    def _refresh_data_async(self) -> None:
+        """Load notes and pending actions off the Tk thread; results arrive via ``msg_queue``.
+
+        The current lists stay on screen (and pageable) until the new ones replace them.
+        """
+        self._load_generation += 1
+        self._submit_background(self._refresh_notes_worker, self._load_generation, self._notes_limit)
+        self._submit_background(self._refresh_actions_worker, self._load_generation)
+
+    def _mark_notes_user_scroll(self, _event: tk.Event | None = None) -> None:
+        self._notes_user_scrolled = True
+
+    def _on_notes_yview(self, first: str, last: str) -> None:
+        """Scroll callback of the notes tree: fetch the next page when a user scroll reaches the end.
+
+        Tk also calls this when the content changes; a short or filtered view always reports
+        ``last == 1.0``, so without a user scroll it must not keep paging.
+        """
+        user_scrolled, self._notes_user_scrolled = self._notes_user_scrolled, False
+        if not user_scrolled or float(last) < 1.0 or not self._notes_has_more:
+            return
+        if self._notes_page_loading or self._notes_cache is None:
+            return
+        self._notes_page_loading = True
+        offset = self._notes_limit
+        self._notes_limit += _NOTES_PAGE_SIZE
+        self._submit_background(self._load_notes_page_worker, self._load_generation, offset)
+
+    def _load_notes_page_worker(self, generation: int, offset: int) -> None:
+        try:
+            notes = self._reader_service.list_notes(limit=_NOTES_PAGE_SIZE, offset=offset)
+        except Exception:  # noqa: BLE001
+            logger.exception("No se pudieron cargar más notas")
+            # Sin datos, pero se deja abierta la posibilidad de reintentar con otro desplazamiento.
+            self._post_message("notes_page", (generation, [], True))
+            return
+        self._post_message("notes_page", (generation, notes, len(notes) >= _NOTES_PAGE_SIZE))
+
+    def _refresh_notes_worker(self, generation: int, limit: int) -> None:
+        try:
+            notes = self._reader_service.list_notes(limit=limit)
+            self._post_message("notes_data", (generation, notes, len(notes) >= limit))
+        except Exception:  # noqa: BLE001
+            logger.exception("No se pudieron cargar notas")
+            self._post_message("status", "Error al cargar notas")
+
+    def _refresh_actions_worker(self, generation: int) -> None:
+        try:
+            self._post_message("actions_data", (generation, self._reader_service.list_pending_actions()))
+        except Exception:  # noqa: BLE001
+            logger.exception("No se pudieron cargar acciones")
+            self._post_message("status", "Error al cargar acciones")
+
+    def _find_note(self, note_id: int) -> Note | None:
+        """Return the note from the last render, or read that single row if it is not there."""
+        return self._notes_by_id.get(note_id) or self.service.get_note_by_id(note_id)
+
     def refresh_notes(self) -> None:
+        # Solo se pinta lo cargado en segundo plano; sin datos todavía no hay nada que hacer.
+        if self._notes_cache is None:
+            return
         try:
-            notes = self.service.list_notes()
-            self.notes_data = [
-                (note.id, note.title, note.status, note.last_error or "", note.notion_page_id or "")
+            self._notes_by_id = self._notes_cache
+            notes = self._notes_by_id.values()
+            shared = self._shared_strings.setdefault
+            rows = [
+                (
+                    note.id,
+                    note.title,
+                    shared(note.status, note.status),
+                    note.last_error or "",
+                    note.notion_page_id or "",
+                )
                 for note in notes
             ]
+            if rows == self.notes_data:
+                return
+            self.notes_data = rows
+            self._note_urls = {
+                note.id: _notion_page_url(note.notion_page_id) for note in notes if note.notion_page_id
+            }
             self.apply_note_filters()
         except Exception:  # noqa: BLE001
             logger.exception("No se pudieron cargar notas")
             self.status_var.set("Error al cargar notas")
 
     def apply_note_filters(self) -> None:
-        self._entry_filtered_notes_data = list(self.notes_data)
+        # notes_data se reconstruye en cada refresco: compartir la lista permite
+        # que el filtro reutilice sus celdas normalizadas entre aplicaciones.
+        self._entry_filtered_notes_data = self.notes_data
         self.notes_excel_filter.apply()
 
     def _set_notes_filtered_rows(self, rows: list[tuple[int, str, str, str, str]]) -> None:
@@ -1397,26 +1805,28 @@ class MainWindow(ttk.Frame):
         self._refresh_notes_tree(rows)
 
     def _refresh_notes_tree(self, rows: list[tuple[int, str, str, str, str]]) -> None:
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        for note in rows:
-            self.tree.insert("", "end", iid=str(note[0]), values=note)
+        _sync_tree_rows(self.tree, rows, "", self._notes_rendered, self.notes_data, self._notes_visible)
 
     def refresh_actions(self) -> None:
+        if self._actions_cache is None:
+            return
         try:
-            actions = self.service.list_pending_actions()
-            self.actions_data = [
+            actions = self._actions_cache
+            shared = self._shared_strings.setdefault
+            rows = [
                 (
                     action.id,
-                    action.area,
+                    shared(action.area, action.area),
                     action.description,
-                    action.status,
+                    shared(action.status, action.status),
                     action.note_id,
                     action.notion_page_id or "",
                 )
                 for action in actions
             ]
+            if rows == self.actions_data:
+                return
+            self.actions_data = rows
             self.apply_filters()
         except Exception:  # noqa: BLE001
             logger.exception("No se pudieron cargar acciones")
@@ -1427,7 +1837,7 @@ class MainWindow(ttk.Frame):
         # Orden de aplicación acordado:
         # 1) filtros por Entry (contains), cuando existan en la vista
         # 2) filtros Excel (lista/condición + ordenación tipada)
-        self._entry_filtered_actions_data = list(self.actions_data)
+        self._entry_filtered_actions_data = self.actions_data
         self.actions_excel_filter.apply()
 
     def _set_actions_filtered_rows(self, rows: list[tuple[int, str, str, str, int, str]]) -> None:
@@ -1445,11 +1855,32 @@ class MainWindow(ttk.Frame):
         }
 
     def _refresh_actions_tree(self, rows: list[tuple[int, str, str, str, int, str]]) -> None:
-        for row in self.actions_tree.get_children():
-            self.actions_tree.delete(row)
-
-        for action in rows:
-            self.actions_tree.insert("", "end", iid=f"a{action[0]}", values=action)
+        if self._actions_fill_after_id is not None:
+            self.after_cancel(self._actions_fill_after_id)
+            self._actions_fill_after_id = None
+        self._fill_actions_tree(rows, _TREE_FIRST_PAGE_ROWS)
+
+    def _fill_actions_tree(self, rows: list[tuple[int, str, str, str, int, str]], budget: int) -> None:
+        """Show ``rows`` now, except rows not yet on screen beyond the first ``budget``.
+
+        Rows already attached stay in every pass, so later idle-time chunks only add
+        the pending ones instead of detaching and moving the whole prefix again.
+        """
+        self._actions_fill_after_id = None
+        on_screen = set(self._actions_visible)
+        shown: list[tuple[int, str, str, str, int, str]] = []
+        pending = False
+        for row in rows:
+            if f"a{row[0]}" in on_screen:
+                shown.append(row)
+            elif budget > 0:
+                shown.append(row)
+                budget -= 1
+            else:
+                pending = True
+        _sync_tree_rows(self.actions_tree, shown, "a", self._actions_rendered, self.actions_data, self._actions_visible)
+        if pending:
+            self._actions_fill_after_id = self.after_idle(self._fill_actions_tree, rows, _TREE_CHUNK_ROWS)
 
     def _mark_selected_action_done(self) -> None:
         selection = self.actions_tree.selection()
@@ -1462,7 +1893,7 @@ class MainWindow(ttk.Frame):
             completion = self.service.mark_action_done(action_id)
             self._process_completion_event(completion)
             self.status_var.set(f"Acción {action_id} marcada como hecha")
-            self.refresh_actions()
+            self._refresh_data_async()
             if self._calendar_window is not None and self._calendar_window.winfo_exists():
                 self._calendar_window.refresh_calendar_view()
         except Exception:  # noqa: BLE001
@@ -1483,7 +1914,7 @@ class MainWindow(ttk.Frame):
                 for event in events:
                     self._process_completion_event(event)
             self.status_var.set(f"Acciones finalizadas: {len(action_ids)}")
-            self.refresh_actions()
+            self._refresh_data_async()
             if self._calendar_window is not None and self._calendar_window.winfo_exists():
                 self._calendar_window.refresh_calendar_view()
         except Exception:  # noqa: BLE001
@@ -1498,8 +1929,7 @@ class MainWindow(ttk.Frame):
             messagebox.showwarning("Atención", "No hay Notion ID asociado.")
             return
 
-        url = f"https://www.notion.so/{notion_page_id.replace('-', '')}"
-        webbrowser.open(url)
+        webbrowser.open(_notion_page_url(notion_page_id))
 
     def _open_selected_note_google_event(self) -> None:
         selection = self.tree.selection()
@@ -1509,6 +1939,7 @@ class MainWindow(ttk.Frame):
 
         values = self.tree.item(selection[0], "values")
         note_id = int(values[0])
+        # El enlace puede haberse guardado después del último refresco: se lee de SQLite, no de la caché.
         note = self.service.get_note_by_id(note_id)
         if note and note.google_calendar_link:
             webbrowser.open(note.google_calendar_link)
@@ -1523,9 +1954,13 @@ class MainWindow(ttk.Frame):
             messagebox.showwarning("Atención", "Selecciona una nota.")
             return
 
-        values = self.tree.item(selection[0], "values")
-        notion_page_id = values[4]
-        self._open_notion_page(notion_page_id)
+        note_id = int(self.tree.item(selection[0], "values")[0])
+        url = self._note_urls.get(note_id)
+        if url:
+            webbrowser.open(url)
+            return
+        note = self._find_note(note_id)
+        self._open_notion_page(note.notion_page_id if note and note.notion_page_id else "")
 
     def _open_selected_action(self) -> None:
         selection = self.actions_tree.selection()
@@ -1542,7 +1977,11 @@ class MainWindow(ttk.Frame):
             return
 
         if note_id:
-            note = self.service.get_note_by_id(int(note_id))
+            url = self._note_urls.get(int(note_id))
+            if url:
+                webbrowser.open(url)
+                return
+            note = self._find_note(int(note_id))
             if note and note.notion_page_id:
                 self._open_notion_page(note.notion_page_id)
                 return
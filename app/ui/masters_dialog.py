@@ -8,6 +8,7 @@ from tkinter import messagebox, ttk
 
 from app.core.service import NOTION_DISABLED_MESSAGE, NoteService
 from app.ui.app_icons import apply_app_icon
+from app.ui.treeview_batch import insert_tree_rows
 
 logger = logging.getLogger(__name__)
 
@@ -72,15 +73,16 @@ class MastersDialog(tk.Toplevel):
         self.description_text.insert("1.0", value)
 
     def _refresh_rows(self) -> None:
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        self.tree.delete(*self.tree.get_children())
 
+        rows = []
         for row in self.service.list_masters(self.category):
             value = str(row["value"])
             description = str(row["description"] or "")
             active = "Sí" if int(row["active"]) == 1 else "No"
             locked = "Sí" if int(row["system_locked"]) == 1 else "No"
-            self.tree.insert("", "end", iid=value, values=(value, description, active, locked))
+            rows.append((value, (value, description, active, locked)))
+        insert_tree_rows(self.tree, rows)
 
     def _on_selected(self, _event: tk.Event | None = None) -> None:
         selected = self.tree.selection()
@@ -21,6 +21,24 @@ from app.ui.dictation_widgets import attach_dictation
 class SettingsDialog(tk.Toplevel):
     """Modal settings editor grouped by domain tabs."""
 
+    # Campos de texto de AppSettings con el valor usado si están vacíos; crean, cargan y guardan
+    # sus variables del diálogo.
+    _SETTINGS_TEXT_FIELDS: tuple[tuple[str, str], ...] = (
+        ("notion_token", ""),
+        ("notion_database_id", ""),
+        ("managed_email", ""),
+        ("default_area", ""),
+        ("default_tipo", ""),
+        ("default_estado", "Pendiente"),
+        ("default_prioridad", "Media"),
+        ("prop_title", "Actividad"),
+        ("prop_area", "Area"),
+        ("prop_tipo", "Tipo"),
+        ("prop_estado", "Estado"),
+        ("prop_fecha", "Fecha"),
+        ("prop_prioridad", "Prioridad"),
+    )
+
     def __init__(
         self,
         parent: tk.Misc,
@@ -60,24 +78,12 @@ class SettingsDialog(tk.Toplevel):
         self.master_name_var = tk.StringVar()
 
         self.config_vars: dict[str, tk.Variable] = {
-            "notion_token": tk.StringVar(),
-            "notion_database_id": tk.StringVar(),
+            **{key: tk.StringVar() for key, _default in self._SETTINGS_TEXT_FIELDS},
             "notion_enabled": tk.BooleanVar(value=False),
-            "managed_email": tk.StringVar(),
             "nombre": tk.StringVar(),
             "email_principal": tk.StringVar(),
             "dominio": tk.StringVar(),
             "alias": tk.StringVar(),
-            "default_area": tk.StringVar(),
-            "default_tipo": tk.StringVar(),
-            "default_estado": tk.StringVar(),
-            "default_prioridad": tk.StringVar(),
-            "prop_title": tk.StringVar(),
-            "prop_area": tk.StringVar(),
-            "prop_tipo": tk.StringVar(),
-            "prop_estado": tk.StringVar(),
-            "prop_fecha": tk.StringVar(),
-            "prop_prioridad": tk.StringVar(),
             "auto_check_email": tk.BooleanVar(),
             "email_interval": tk.IntVar(),
             "knowledge_auto_download_enabled": tk.BooleanVar(),
@@ -450,24 +456,13 @@ class SettingsDialog(tk.Toplevel):
         email_account = runtime_config.get("email_account", {})
         knowledge_auto_download = runtime_config.get("knowledge_auto_download", {})
         config = {
-            "notion_token": self._current.notion_token,
-            "notion_database_id": self._current.notion_database_id,
+            **{key: getattr(self._current, key) or default for key, default in self._SETTINGS_TEXT_FIELDS},
             "notion_enabled": bool(self._current.notion_enabled),
             "managed_email": str(email_account.get("account_email", "")).strip() or self._current.managed_email,
             "nombre": str(profile.get("nombre", "")).strip(),
             "email_principal": str(profile.get("email_principal", "")).strip(),
             "dominio": str(profile.get("dominio", "")).strip(),
             "alias": ",".join(profile.get("alias", [])),
-            "default_area": self._current.default_area,
-            "default_tipo": self._current.default_tipo,
-            "default_estado": self._current.default_estado,
-            "default_prioridad": self._current.default_prioridad,
-            "prop_title": self._current.prop_title,
-            "prop_area": self._current.prop_area,
-            "prop_tipo": self._current.prop_tipo,
-            "prop_estado": self._current.prop_estado,
-            "prop_fecha": self._current.prop_fecha,
-            "prop_prioridad": self._current.prop_prioridad,
             "auto_check_email": bool(email_settings.get("auto_check", True)),
             "email_interval": int(email_settings.get("interval", 60)),
             "knowledge_auto_download_enabled": bool(knowledge_auto_download.get("enabled", False)),
@@ -584,37 +579,25 @@ class SettingsDialog(tk.Toplevel):
             if not self._validate_config():
                 return
 
-            config = {key: var.get() for key, var in self.config_vars.items()}
+            values = {key: var.get() for key, var in self.config_vars.items()}
 
             settings = AppSettings(
-                notion_token=str(config["notion_token"]).strip(),
-                notion_database_id=str(config["notion_database_id"]).strip(),
-                notion_enabled=bool(config["notion_enabled"]),
-                managed_email=str(config["managed_email"]).strip(),
-                default_area=str(config["default_area"]).strip(),
-                default_tipo=str(config["default_tipo"]).strip(),
-                default_estado=str(config["default_estado"]).strip() or "Pendiente",
-                default_prioridad=str(config["default_prioridad"]).strip() or "Media",
-                prop_title=str(config["prop_title"]).strip() or "Actividad",
-                prop_area=str(config["prop_area"]).strip() or "Area",
-                prop_tipo=str(config["prop_tipo"]).strip() or "Tipo",
-                prop_estado=str(config["prop_estado"]).strip() or "Estado",
-                prop_fecha=str(config["prop_fecha"]).strip() or "Fecha",
-                prop_prioridad=str(config["prop_prioridad"]).strip() or "Prioridad",
+                **{key: str(values[key]).strip() or default for key, default in self._SETTINGS_TEXT_FIELDS},
+                notion_enabled=bool(values["notion_enabled"]),
                 max_attempts=self._current.max_attempts,
                 retry_delay_seconds=self._current.retry_delay_seconds,
             )
             self._on_save(settings)
             config = self.config_manager.load()
-            email_principal = str(self.config_vars["email_principal"].get()).strip().lower()
-            managed_email = str(self.config_vars["managed_email"].get()).strip().lower()
+            email_principal = str(values["email_principal"]).strip().lower()
+            managed_email = str(values["managed_email"]).strip().lower()
             config["user_profile"] = {
-                "nombre": str(self.config_vars["nombre"].get()).strip(),
+                "nombre": str(values["nombre"]).strip(),
                 "email_principal": email_principal or managed_email,
-                "dominio": str(self.config_vars["dominio"].get()).strip().lower(),
+                "dominio": str(values["dominio"]).strip().lower(),
                 "alias": [
                     alias.strip().lower()
-                    for alias in str(self.config_vars["alias"].get()).split(",")
+                    for alias in str(values["alias"]).split(",")
                     if alias.strip()
                 ],
             }
@@ -623,14 +606,14 @@ class SettingsDialog(tk.Toplevel):
                 "account_email": managed_email or email_principal,
             }
             config["email_settings"] = {
-                "auto_check": bool(self.config_vars["auto_check_email"].get()),
-                "interval": max(10, int(self.config_vars["email_interval"].get() or 60)),
+                "auto_check": bool(values["auto_check_email"]),
+                "interval": max(10, int(values["email_interval"] or 60)),
             }
             config["knowledge_auto_download"] = {
-                "enabled": bool(self.config_vars["knowledge_auto_download_enabled"].get()),
-                "interval_minutes": max(1, int(self.config_vars["knowledge_auto_download_interval_minutes"].get() or 10)),
-                "on_startup": bool(self.config_vars["knowledge_auto_download_on_startup"].get()),
-                "silent": bool(self.config_vars["knowledge_auto_download_silent"].get()),
+                "enabled": bool(values["knowledge_auto_download_enabled"]),
+                "interval_minutes": max(1, int(values["knowledge_auto_download_interval_minutes"] or 10)),
+                "on_startup": bool(values["knowledge_auto_download_on_startup"]),
+                "silent": bool(values["knowledge_auto_download_silent"]),
             }
             config["order_validation"] = {
                 "required_fields": [
@@ -640,7 +623,7 @@ class SettingsDialog(tk.Toplevel):
                 ],
             }
             config["ocr_settings"] = {
-                "tesseract_path": str(self.config_vars["ocr_tesseract_path"].get()).strip(),
+                "tesseract_path": str(values["ocr_tesseract_path"]).strip(),
             }
             self.config_manager.save(config)
             self.master.event_generate("<<KnowledgeDownloadSettingsChanged>>")
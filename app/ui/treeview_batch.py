@@ -0,0 +1,38 @@
+"""Batch helpers to populate ttk.Treeview widgets with a single Tcl evaluation."""
+
+from __future__ import annotations
+
+from tkinter import ttk
+from typing import Any, Iterable, Sequence
+
+# Caracteres de control (incluidos \f, \v y NUL, que Tcl trata como separadores o no admite en
+# el script) se escriben como \uXXXX para que cada valor siga siendo una sola palabra.
+_TCL_ESCAPES = {chr(code): f"\\u{code:04x}" for code in (*range(0x20), 0x7F)}
+_TCL_SPECIAL = set(' {}[]$";\\')
+
+
+def tcl_escape(value: Any) -> str:
+    """Return ``value`` as a single Tcl word that evaluates back to ``str(value)``."""
+    text = str(value)
+    if text == "":
+        return "{}"
+    parts = []
+    for char in text:
+        if char in _TCL_ESCAPES:
+            parts.append(_TCL_ESCAPES[char])
+        elif char in _TCL_SPECIAL:
+            parts.append("\\" + char)
+        else:
+            parts.append(char)
+    return "".join(parts)
+
+
+def insert_tree_rows(tree: ttk.Treeview, rows: Iterable[tuple[str, Sequence[Any]]]) -> None:
+    """Append ``(iid, values)`` rows at the end of ``tree`` in one Tcl round trip."""
+    widget = tree._w
+    script = "".join(
+        f"{widget} insert {{}} end -id {tcl_escape(iid)} -values [list {' '.join(tcl_escape(v) for v in values)}]\n"
+        for iid, values in rows
+    )
+    if script:
+        tree.tk.eval(script)
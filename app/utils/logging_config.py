@@ -2,22 +2,66 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
+_LOG_MAX_BYTES = 5_000_000
+_LOG_BACKUP_COUNT = 3
+_LISTENER: logging.handlers.QueueListener | None = None
+
 
 def configure_logging(log_dir: Path) -> Path:
-    """Configure logging and return log file path."""
+    """Configure logging and return log file path.
+
+    Records are only enqueued by the emitting thread; a background listener
+    owns the file and console handlers so disk latency never blocks the UI.
+    """
+    stop_logging()
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "app.log"
 
+    formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    handlers: list[logging.Handler] = [
+        logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        ),
+        logging.StreamHandler(),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    # El QueueHandler solo fusiona mensaje y argumentos; el formato final lo
+    # aplican los handlers del listener.
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(),
-        ],
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
         force=True,
     )
+
+    global _LISTENER
+    _LISTENER = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LISTENER.start()
     return log_file
+
+
+def stop_logging() -> None:
+    """Flush pending records and stop the background listener, if running."""
+    global _LISTENER
+    if _LISTENER is None:
+        return
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
+
+
+atexit.register(stop_logging)
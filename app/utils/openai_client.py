@@ -2,35 +2,87 @@
 
 from __future__ import annotations
 
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 MODEL_NAME = "gpt-4o-mini"
-API_KEY_PATH = Path.home() / "AppData" / "Roaming" / "NotionSecondBrain" / "KeySecret.txt"
+# La ruta se calcula una sola vez como str: os.stat/open la usan sin pasar por pathlib.
+_KEY_STR = os.path.join(
+    os.environ.get("APPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Roaming")),
+    "NotionSecondBrain",
+    "KeySecret.txt",
+)
+API_KEY_PATH = Path(_KEY_STR)
+
+# (ruta, mtime_ns, clave) de la última lectura válida de _KEY_STR.
+_KEY_CACHE: tuple[str, int, str] | None = None
+_KEY_LOCK = threading.Lock()
+# openai tarda en importarse: se carga al crear el primer cliente, no al importar este módulo.
+_OPENAI_CLASS = None
 
 
 def load_api_key() -> str:
-    """Load API key from plain text file and validate expected format."""
-    if not API_KEY_PATH.exists():
+    """Load API key from plain text file and validate expected format.
+
+    The key is kept in memory and only re-read when the file's mtime changes.
+    """
+    global _KEY_CACHE
+    path = _KEY_STR
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
         raise RuntimeError(
-            f"No se encontró la clave de OpenAI en: {API_KEY_PATH}. "
+            f"No se encontró la clave de OpenAI en: {path}. "
             "Crea el archivo con la clave en texto plano."
-        )
+        ) from None
 
-    key = API_KEY_PATH.read_text(encoding="utf-8").strip()
-    if not key or not key.startswith("sk-"):
-        raise RuntimeError(
-            f"Clave de OpenAI inválida en {API_KEY_PATH}. "
-            "Debe contener solo una clave que empiece por 'sk-'."
-        )
+    cached = _KEY_CACHE
+    if cached is not None and cached[0] == path and cached[1] == mtime_ns:
+        return cached[2]
+
+    with _KEY_LOCK:
+        # La clave es ASCII: se valida sobre los bytes y solo se decodifica una vez.
+        with open(path, "rb") as handle:
+            data = handle.read().strip()
+        if not data.startswith(b"sk-") or not data.isascii():
+            raise RuntimeError(
+                f"Clave de OpenAI inválida en {path}. "
+                "Debe contener solo una clave que empiece por 'sk-'."
+            )
+        key = data.decode("ascii")
+        _KEY_CACHE = (path, mtime_ns, key)
     return key
 
 
+def clear_api_key_cache() -> None:
+    """Forget the cached API key and client so the next call reads the file again."""
+    global _KEY_CACHE
+    with _KEY_LOCK:
+        _KEY_CACHE = None
+    _client_for.cache_clear()
+
+
+def _openai_class():
+    """Import ``openai.OpenAI`` on first use and keep the class for later calls."""
+    global _OPENAI_CLASS
+    if _OPENAI_CLASS is None:
+        try:
+            from openai import OpenAI
+        except ModuleNotFoundError as exc:  # pragma: no cover - depends on runtime env
+            raise RuntimeError(
+                "La librería 'openai' no está instalada. Ejecuta: pip install openai"
+            ) from exc
+        _OPENAI_CLASS = OpenAI
+    return _OPENAI_CLASS
+
+
+@lru_cache(maxsize=1)
+def _client_for(api_key: str):
+    return _openai_class()(api_key=api_key, timeout=20.0)
+
+
 def build_openai_client():
-    """Create an authenticated OpenAI client instance."""
-    try:
-        from openai import OpenAI
-    except ModuleNotFoundError as exc:  # pragma: no cover - depends on runtime env
-        raise RuntimeError(
-            "La librería 'openai' no está instalada. Ejecuta: pip install openai"
-        ) from exc
-    return OpenAI(api_key=load_api_key(), timeout=20.0)
+    """Return the authenticated OpenAI client, reused while the API key stays the same."""
+    return _client_for(load_api_key())
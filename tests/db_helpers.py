@@ -0,0 +1,23 @@
+"""SQLite helpers shared by the test modules."""
+
+import sqlite3
+
+from app.persistence.db import Database
+
+# Base en memoria compartida: migrate() y la conexión plantilla ven la misma base sin tocar disco.
+_TEMPLATE_URI = "file:nsb_tests_template?mode=memory&cache=shared"
+_template: sqlite3.Connection | None = None
+
+
+def migrated_connection() -> sqlite3.Connection:
+    """Return a private in-memory copy of a database migrated once for the whole test run."""
+    global _template
+    if _template is None:
+        db = Database(_TEMPLATE_URI, durable=False)
+        # La base compartida vive mientras quede una conexión abierta: la plantilla la retiene.
+        _template = db.connect()
+        db.migrate()
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    _template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    return conn
@@ -3,7 +3,7 @@ from app.persistence.db import Database
 
 
 def test_calendar_repository_upsert_and_selected(tmp_path):
-    db = Database(tmp_path / "test.db")
+    db = Database(tmp_path / "test.db", durable=False)
     db.migrate()
     conn = db.connect()
     repo = CalendarRepository(conn)
@@ -1,18 +1,27 @@
 import unittest
+from dataclasses import replace
 from unittest.mock import patch
 from datetime import datetime
 
 from app.core.hashing import compute_source_id
-from app.core.models import NoteCreateRequest
+from app.core.models import Action, AppSettings, Note, NoteCreateRequest
 from app.core.normalizer import normalize_text
 from app.core.processor import ProcessedNote
 from app.core.service import NoteService
-from app.persistence.db import Database
 from app.persistence.masters_repository import MastersRepository
 from app.persistence.repositories import ActionsRepository, NoteRepository, SettingsRepository
 
+from db_helpers import migrated_connection
+
+# Estado y propiedad con los que se cierra una página de Notion (AppSettings.prop_estado por defecto).
+_FINALIZE_ARGS = ("Finalizado", "Estado")
+
 
 class NormalizerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        normalize_text("warm", "manual")
+
     def test_normalize_basic_whitespace(self):
         text = "  Hola\r\n\r\n   mundo\t\t test  "
         self.assertEqual(normalize_text(text, "manual"), "Hola\n\nmundo test")
@@ -21,6 +30,15 @@ class NormalizerTests(unittest.TestCase):
         text = "Asunto: X\nRemitente: Y\nContenido\n\nSaludos\nJuan"
         self.assertEqual(normalize_text(text, "email_pasted"), "Asunto: X\nRemitente: Y\nContenido")
 
+    def test_collapse_keeps_line_breaks_and_strips_each_line(self):
+        text = "a \t b\n\t c  d \n\n  e"
+        self.assertEqual(normalize_text(text, "manual"), "a b\nc d\n\ne")
+
+    def test_normalize_keeps_blank_lines_and_non_breaking_spaces(self):
+        # El texto normalizado alimenta compute_source_id: no debe cambiar para notas ya guardadas.
+        self.assertEqual(normalize_text("a\n\n\nb c", "manual"), "a\n\n\nb c")
+        self.assertEqual(normalize_text("a\u00a0\u00a0b  c", "manual"), "a\u00a0\u00a0b c")
+
 
 class HashTests(unittest.TestCase):
     def test_hash_is_stable(self):
@@ -29,12 +47,48 @@ class HashTests(unittest.TestCase):
             compute_source_id("abc", "manual"),
         )
 
+    def test_hash_matches_ids_already_stored(self):
+        self.assertEqual(
+            compute_source_id("abc", "manual"),
+            "47de21ad620297547544d0ad4c1280fe2985f57c1563832b9c1cc14784539959",
+        )
+
+
+_CREATED_AT = "2025-01-01T00:00:00"
+
 
 class DedupTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._TODAY_ISO = datetime.now().date().isoformat()
+        # Plantilla de petición: cada test solo indica los campos que cambian.
+        cls._BASE_REQ = NoteCreateRequest(
+            title="",
+            raw_text="",
+            source="manual",
+            area="A",
+            tipo="",
+            estado="Pendiente",
+            prioridad="",
+            fecha=cls._TODAY_ISO,
+        )
+        # Un único patcher por clase; setUp deja los mocks limpios para cada test.
+        process_patcher = patch("app.core.service.process_text")
+        cls.mock_process_text = process_patcher.start()
+        cls.addClassCleanup(process_patcher.stop)
+        notion_patcher = patch("app.core.service.NotionClient")
+        cls.mock_notion_client = notion_patcher.start()
+        cls.addClassCleanup(notion_patcher.stop)
+        # Marca de creación fija: created_at determinista y sin consultar el reloj en cada nota.
+        clock_patcher = patch.object(AppSettings, "now_iso", staticmethod(lambda: _CREATED_AT))
+        clock_patcher.start()
+        cls.addClassCleanup(clock_patcher.stop)
+
     def setUp(self):
-        self.db = Database(DatabasePathHelper.path())
-        self.db.migrate()
-        self.conn = self.db.connect()
+        self.mock_process_text.reset_mock(return_value=True, side_effect=True)
+        self.mock_process_text.return_value = ProcessedNote("", [], "", "")
+        self.mock_notion_client.reset_mock(return_value=True, side_effect=True)
+        self.conn = migrated_connection()
         self.service = NoteService(
             NoteRepository(self.conn),
             SettingsRepository(self.conn),
@@ -45,43 +99,101 @@ class DedupTests(unittest.TestCase):
     def tearDown(self):
         self.conn.close()
 
-    @patch("app.core.service.process_text", return_value=ProcessedNote("", [], "", ""))
-    def test_duplicate_note_is_blocked(self, _mock_process_text):
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto duplicado",
-            source="manual",
-            area="A",
-            tipo="T",
-            estado="Pendiente",
-            prioridad="Media",
-            fecha=datetime.now().date().isoformat(),
+    def _seed_synced_note(self, actions: list[str]) -> tuple[int, int | None]:
+        """Create a note already sent to Notion (integration enabled), its first action linked to a task."""
+        self.mock_process_text.return_value = ProcessedNote(
+            resumen="Resumen AI",
+            acciones=actions,
+            tipo_sugerido="Nota",
+            prioridad_sugerida="Media",
+        )
+        req = replace(
+            self._BASE_REQ,
+            raw_text="Texto con una tarea" if actions else "Texto sin tareas",
+            area="Ventas",
         )
         note_id, _ = self.service.create_note(req)
+        self.service.save_settings(
+            replace(self.service.get_settings(), notion_token="token", notion_enabled=True)
+        )
+        self.service.note_repo.mark_sent(note_id, "notion-page-123")
+        action_id = None
+        if actions:
+            action_id = self.service.actions_repo.get_actions_by_note(note_id)[0].id
+            self.service.actions_repo.set_notion_page_id(action_id, "task-page-1")
+        return note_id, action_id
+
+    def test_duplicate_note_is_blocked(self):
+        req = replace(self._BASE_REQ, raw_text="Texto duplicado", tipo="T", prioridad="Media")
+        note_id, _ = self.service.create_note(req)
         self.assertIsNotNone(note_id)
 
         note_id_2, msg = self.service.create_note(req)
         self.assertIsNone(note_id_2)
         self.assertIn("duplicada", msg.lower())
 
-    @patch("app.core.service.process_text")
-    def test_create_note_applies_ai_enrichment(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_duplicate_inserted_concurrently_is_reported_without_actions(self):
+        self.mock_process_text.return_value = ProcessedNote("Resumen", ["Tarea"], "Nota", "Media")
+        req = replace(self._BASE_REQ, raw_text="Texto en carrera", tipo="T", prioridad="Media")
+        first_id, _ = self.service.create_note(req)
+
+        with patch.object(self.service.note_repo, "source_exists", return_value=False):
+            note_id, msg = self.service.create_note(req)
+
+        self.assertIsNone(note_id)
+        self.assertIn("duplicada", msg)
+        self.assertEqual(len(self.service.actions_repo.get_actions_by_note(first_id)), 1)
+
+    def test_get_note_by_id_reads_single_row_by_primary_key(self):
+        note_id, _ = self.service.create_note(
+            replace(
+                self._BASE_REQ,
+                title="Buscada",
+                raw_text="Texto buscado",
+                tipo="T",
+                prioridad="Media",
+            )
+        )
+
+        statements: list[str] = []
+        self.conn.set_trace_callback(statements.append)
+        note = self.service.get_note_by_id(note_id)
+        self.conn.set_trace_callback(None)
+        # El trazado entrega la sentencia con los parámetros ya sustituidos.
+        plan = self.conn.execute(f"EXPLAIN QUERY PLAN {statements[-1]}").fetchall()
+
+        self.assertEqual(note.title, "Buscada")
+        self.assertIsNone(self.service.get_note_by_id(note_id + 1000))
+        self.assertEqual(len(statements), 1)
+        self.assertIn("INTEGER PRIMARY KEY", " ".join(str(row[-1]) for row in plan))
+
+    def test_list_notes_pages_with_offset(self):
+        for idx in range(3):
+            self.service.create_note(
+                replace(
+                    self._BASE_REQ,
+                    title=f"Nota {idx}",
+                    raw_text=f"Texto paginado {idx}",
+                    tipo="T",
+                    prioridad="Media",
+                )
+            )
+
+        first_page = self.service.list_notes(limit=2)
+        second_page = self.service.list_notes(limit=2, offset=2)
+
+        self.assertEqual(len(first_page), 2)
+        self.assertEqual(len(second_page), 1)
+        self.assertLess(second_page[0].id, first_page[-1].id)
+
+    def test_create_note_applies_ai_enrichment(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Acción 1", "Acción 2"],
             tipo_sugerido="Incidencia",
             prioridad_sugerida="Alta",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con tarea",
-            source="manual",
-            area="A",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con tarea")
         note_id, _ = self.service.create_note(req)
         note = self.service.note_repo.get_note(note_id)
 
@@ -91,24 +203,14 @@ class DedupTests(unittest.TestCase):
         self.assertEqual(note.prioridad, "Alta")
 
 
-    @patch("app.core.service.process_text")
-    def test_create_note_creates_pending_actions(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_create_note_creates_pending_actions(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Tarea 1", "Tarea 2"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con tareas",
-            source="manual",
-            area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con tareas", area="Operaciones")
         note_id, _ = self.service.create_note(req)
         actions = self.service.actions_repo.get_actions_by_note(note_id)
 
@@ -116,24 +218,14 @@ class DedupTests(unittest.TestCase):
         self.assertTrue(all(action.status == "pendiente" for action in actions))
 
 
-    @patch("app.core.service.process_text")
-    def test_note_without_actions_starts_as_finalizado(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_note_without_actions_starts_as_finalizado(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen",
             acciones=[],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto informativo",
-            source="manual",
-            area="A",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto informativo")
 
         note_id, _ = self.service.create_note(req)
         note = self.service.note_repo.get_note(note_id)
@@ -141,24 +233,14 @@ class DedupTests(unittest.TestCase):
         self.assertEqual(note.estado, "Finalizado")
 
 
-    @patch("app.core.service.process_text")
-    def test_update_action_date_preserves_time_component(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_update_action_date_preserves_time_component(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Mover tarea"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con una tarea",
-            source="manual",
-            area="Ventas",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con una tarea", area="Ventas")
         note_id, _ = self.service.create_note(req)
         action = self.service.actions_repo.get_actions_by_note(note_id)[0]
 
@@ -168,24 +250,14 @@ class DedupTests(unittest.TestCase):
         self.assertIsNotNone(updated)
         assert updated is not None
         self.assertTrue(updated.created_at.startswith("2026-01-20T"))
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_updates_status(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_action_done_updates_status(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Tarea única"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con una tarea",
-            source="manual",
-            area="Ventas",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con una tarea", area="Ventas")
         note_id, _ = self.service.create_note(req)
         action = self.service.actions_repo.get_actions_by_note(note_id)[0]
 
@@ -198,177 +270,39 @@ class DedupTests(unittest.TestCase):
         self.assertEqual(note.estado, "Finalizado")
 
 
-    @patch("app.core.service.NotionClient")
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_syncs_notion_when_page_is_available(self, mock_process_text, mock_notion_client):
-        mock_process_text.return_value = ProcessedNote(
-            resumen="Resumen AI",
-            acciones=["Tarea Notion"],
-            tipo_sugerido="Nota",
-            prioridad_sugerida="Media",
-        )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con una tarea",
-            source="manual",
-            area="Ventas",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
-        note_id, _ = self.service.create_note(req)
-        self.service.settings_repo.set_setting("notion_token", "token")
-        self.service.note_repo.mark_sent(note_id, "notion-page-123")
-        action = self.service.actions_repo.get_actions_by_note(note_id)[0]
-        self.service.actions_repo.set_notion_page_id(action.id, "task-page-1")
-        mock_notion_client.return_value.count_open_tasks_by_fuente_id.return_value = 1
-
-        self.service.mark_action_done(action.id)
-
-        mock_notion_client.return_value.update_page_status.assert_called_once_with(
-            "task-page-1",
-            "Finalizado",
-            "Estado",
-        )
-
-    @patch("app.core.service.NotionClient")
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_logs_notion_errors_without_breaking(self, mock_process_text, mock_notion_client):
-        mock_process_text.return_value = ProcessedNote(
-            resumen="Resumen AI",
-            acciones=["Tarea Notion"],
-            tipo_sugerido="Nota",
-            prioridad_sugerida="Media",
-        )
-        mock_notion_client.return_value.update_page_status.side_effect = RuntimeError("boom")
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con una tarea",
-            source="manual",
-            area="Ventas",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
-        note_id, _ = self.service.create_note(req)
-        self.service.settings_repo.set_setting("notion_token", "token")
-        self.service.note_repo.mark_sent(note_id, "notion-page-123")
-        action = self.service.actions_repo.get_actions_by_note(note_id)[0]
-        self.service.actions_repo.set_notion_page_id(action.id, "task-page-1")
-
-        self.service.mark_action_done(action.id)
-
-        updated = self.service.actions_repo.get_actions_by_note(note_id)[0]
-        self.assertEqual(updated.status, "hecha")
-
-    @patch("app.core.service.NotionClient")
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_closes_parent_note_when_all_tasks_are_done(self, mock_process_text, mock_notion_client):
-        mock_process_text.return_value = ProcessedNote(
-            resumen="Resumen AI",
-            acciones=["Tarea Notion"],
-            tipo_sugerido="Nota",
-            prioridad_sugerida="Media",
-        )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con una tarea",
-            source="manual",
-            area="Ventas",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
-        note_id, _ = self.service.create_note(req)
-        self.service.settings_repo.set_setting("notion_token", "token")
-        self.service.settings_repo.set_setting("notion_database_id", "db")
-        self.service.note_repo.mark_sent(note_id, "notion-page-123")
-        action = self.service.actions_repo.get_actions_by_note(note_id)[0]
-        self.service.actions_repo.set_notion_page_id(action.id, "task-page-1")
-        mock_notion_client.return_value.count_open_tasks_by_fuente_id.return_value = 0
-
-        self.service.mark_action_done(action.id)
-
-        self.assertEqual(mock_notion_client.return_value.update_page_status.call_count, 2)
-
-    @patch("app.core.service.process_text")
-    def test_mark_note_done_blocks_when_has_pending_tasks(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_note_done_blocks_when_has_pending_tasks(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Tarea pendiente"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con tarea",
-            source="manual",
-            area="A",
-            tipo="Nota",
-            estado="Pendiente",
-            prioridad="Media",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con tarea", tipo="Nota", prioridad="Media")
         note_id, _ = self.service.create_note(req)
 
         with self.assertRaisesRegex(ValueError, "tareas pendientes"):
             self.service.mark_note_done(note_id)
 
-    @patch("app.core.service.NotionClient")
-    @patch("app.core.service.process_text")
-    def test_mark_note_done_updates_local_and_notion(self, mock_process_text, mock_notion_client):
-        mock_process_text.return_value = ProcessedNote(
-            resumen="Resumen AI",
-            acciones=[],
-            tipo_sugerido="Nota",
-            prioridad_sugerida="Media",
-        )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto sin tareas",
-            source="manual",
-            area="A",
-            tipo="Nota",
-            estado="Pendiente",
-            prioridad="Media",
-            fecha=datetime.now().date().isoformat(),
-        )
-        note_id, _ = self.service.create_note(req)
-        self.service.settings_repo.set_setting("notion_token", "token")
-        self.service.note_repo.mark_sent(note_id, "notion-page-123")
+    def test_mark_note_done_updates_local_and_notion(self):
+        note_id, _action_id = self._seed_synced_note([])
 
         self.service.mark_note_done(note_id)
 
         note = self.service.note_repo.get_note(note_id)
         self.assertEqual(note.estado, "Finalizado")
-        mock_notion_client.return_value.update_page_status.assert_called_once_with(
-            "notion-page-123",
-            "Finalizado",
-            "Estado",
+        self.mock_notion_client.return_value.update_page_status.assert_called_once_with(
+            "notion-page-123", *_FINALIZE_ARGS
         )
 
 
-    @patch("app.core.service.process_text")
-    def test_mark_actions_done_supports_bulk_updates(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_actions_done_supports_bulk_updates(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Tarea 1", "Tarea 2"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con tareas",
-            source="manual",
-            area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con tareas", area="Operaciones")
         note_id, _ = self.service.create_note(req)
         actions = self.service.actions_repo.get_actions_by_note(note_id)
 
@@ -380,24 +314,14 @@ class DedupTests(unittest.TestCase):
         self.assertEqual(note.estado, "Finalizado")
 
 
-    @patch("app.core.service.process_text")
-    def test_mark_actions_done_tolerates_sync_failures(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_actions_done_tolerates_sync_failures(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Tarea 1", "Tarea 2"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con tareas",
-            source="manual",
-            area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con tareas", area="Operaciones")
         note_id, _ = self.service.create_note(req)
         actions = self.service.actions_repo.get_actions_by_note(note_id)
 
@@ -409,23 +333,18 @@ class DedupTests(unittest.TestCase):
         note = self.service.note_repo.get_note(note_id)
         self.assertEqual(note.estado, "Finalizado")
 
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_replies_email_when_last_task_is_completed(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_action_done_replies_email_when_last_task_is_completed(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Revisar pedido", "Confirmar transporte"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
+        req = replace(
+            self._BASE_REQ,
             raw_text="Te envío el pedido para revisión",
             source="email_pasted",
             area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
             email_id="email-entry-123",
         )
         note_id, _ = self.service.create_note(req)
@@ -442,23 +361,18 @@ class DedupTests(unittest.TestCase):
         self.assertIn("• Revisar pedido", str(second_completion["body"]))
         self.assertIn("• Confirmar transporte", str(second_completion["body"]))
 
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_uses_fallback_summary_when_actions_are_empty(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_action_done_uses_fallback_summary_when_actions_are_empty(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Gestionar caso"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
+        req = replace(
+            self._BASE_REQ,
             raw_text="Consulta general",
             source="email_pasted",
             area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
             email_id="email-entry-456",
         )
         note_id, _ = self.service.create_note(req)
@@ -472,24 +386,14 @@ class DedupTests(unittest.TestCase):
             self.assertEqual(completion["gmail_id"], "email-entry-456")
             self.assertIn("• Gestión completada.", str(completion["body"]))
 
-    @patch("app.core.service.process_text")
-    def test_create_note_keeps_manual_tipo_prioridad(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_create_note_keeps_manual_tipo_prioridad(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=[],
             tipo_sugerido="Incidencia",
             prioridad_sugerida="Alta",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con tarea",
-            source="manual",
-            area="A",
-            tipo="Nota",
-            estado="Pendiente",
-            prioridad="Media",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con tarea", tipo="Nota", prioridad="Media")
         note_id, _ = self.service.create_note(req)
         note = self.service.note_repo.get_note(note_id)
 
@@ -497,23 +401,18 @@ class DedupTests(unittest.TestCase):
         self.assertEqual(note.prioridad, "Media")
 
 
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_replies_even_without_user_confirmation_prompt(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_action_done_replies_even_without_user_confirmation_prompt(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Gestionar caso"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
+        req = replace(
+            self._BASE_REQ,
             raw_text="Consulta general",
             source="email_pasted",
             area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
             email_id="email-entry-789",
         )
         note_id, _ = self.service.create_note(req)
@@ -525,23 +424,18 @@ class DedupTests(unittest.TestCase):
         note = self.service.note_repo.get_note(note_id)
         self.assertEqual(note.email_replied, 0)
 
-    @patch("app.core.service.process_text")
-    def test_mark_action_done_avoids_duplicate_email_reply(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_mark_action_done_avoids_duplicate_email_reply(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Gestionar caso"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
+        req = replace(
+            self._BASE_REQ,
             raw_text="Consulta general",
             source="email_pasted",
             area="Operaciones",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
             email_id="email-entry-999",
         )
         note_id, _ = self.service.create_note(req)
@@ -555,24 +449,14 @@ class DedupTests(unittest.TestCase):
         note = self.service.note_repo.get_note(note_id)
         self.assertEqual(note.email_replied, 0)
 
-    @patch("app.core.service.process_text")
-    def test_toggle_action_status_reopens_done_action(self, mock_process_text):
-        mock_process_text.return_value = ProcessedNote(
+    def test_toggle_action_status_reopens_done_action(self):
+        self.mock_process_text.return_value = ProcessedNote(
             resumen="Resumen AI",
             acciones=["Tarea única"],
             tipo_sugerido="Nota",
             prioridad_sugerida="Media",
         )
-        req = NoteCreateRequest(
-            title="",
-            raw_text="Texto con una tarea",
-            source="manual",
-            area="Ventas",
-            tipo="",
-            estado="Pendiente",
-            prioridad="",
-            fecha=datetime.now().date().isoformat(),
-        )
+        req = replace(self._BASE_REQ, raw_text="Texto con una tarea", area="Ventas")
         note_id, _ = self.service.create_note(req)
         action = self.service.actions_repo.get_actions_by_note(note_id)[0]
 
@@ -586,17 +470,13 @@ class DedupTests(unittest.TestCase):
         self.assertEqual(note.estado, "Pendiente")
 
 
-    @patch("app.core.service.NotionClient")
-    def test_update_note_title_syncs_notion_when_available(self, mock_notion_client):
-        req = NoteCreateRequest(
+    def test_update_note_title_syncs_notion_when_available(self):
+        req = replace(
+            self._BASE_REQ,
             title="Inicial",
             raw_text="Texto",
-            source="manual",
-            area="A",
             tipo="Nota",
-            estado="Pendiente",
             prioridad="Media",
-            fecha=datetime.now().date().isoformat(),
         )
         note_id, _ = self.service.create_note(req)
         self.service.settings_repo.set_setting("notion_token", "token")
@@ -607,22 +487,171 @@ class DedupTests(unittest.TestCase):
 
         updated = self.service.note_repo.get_note(note_id)
         self.assertEqual(updated.title, "Nuevo título")
-        mock_notion_client.return_value.update_page_title.assert_called_once_with(
+        self.mock_notion_client.return_value.update_page_title.assert_called_once_with(
             "notion-page-xyz",
             "Nuevo título",
             "Actividad",
         )
 
 
-class DatabasePathHelper:
-    @staticmethod
-    def path():
-        from pathlib import Path
+class SettingsRepositoryCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = migrated_connection()
+        self.repo = SettingsRepository(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_reads_are_served_from_memory_until_a_write(self):
+        self.repo.load()
+        statements: list[str] = []
+        self.conn.set_trace_callback(statements.append)
+
+        self.repo.load()
+        self.repo.get_setting("notion_token")
+        self.assertEqual(statements, [])
+
+        self.repo.set_setting("notion_token", "nuevo")
+        self.assertEqual(self.repo.get_setting("notion_token"), "nuevo")
+        self.assertEqual(self.repo.load().notion_token, "nuevo")
+        self.assertFalse(any(sql.lstrip().upper().startswith("SELECT") for sql in statements))
+
+    def test_load_returns_independent_copies(self):
+        settings = self.repo.load()
+        settings.notion_token = "modificado"
+
+        self.assertNotEqual(self.repo.load().notion_token, "modificado")
+
+    def test_reload_sees_writes_made_through_another_repository(self):
+        self.repo.load()
+        SettingsRepository(self.conn).set_setting("notion_database_id", "db-externa")
+
+        self.assertEqual(self.repo.load().notion_database_id, "")
+        self.repo.reload()
+        self.assertEqual(self.repo.load().notion_database_id, "db-externa")
+
+
+class _FakeNoteRepo:
+    def __init__(self, notes):
+        self.notes = {note.id: note for note in notes}
+
+    def get_note(self, note_id):
+        return self.notes.get(note_id)
+
+    def update_estado(self, note_id, estado):
+        self.notes[note_id] = replace(self.notes[note_id], estado=estado)
+
+
+class _FakeSettingsRepo:
+    def __init__(self, settings):
+        self.settings = settings
+
+    def load(self):
+        return self.settings
+
+
+class _FakeMastersRepo:
+    def ensure_default_values(self):
+        pass
+
+
+class _FakeActionsRepo:
+    def __init__(self, actions):
+        self.actions = {action.id: action for action in actions}
+
+    def get_action(self, action_id):
+        return self.actions.get(action_id)
+
+    def mark_action_done(self, action_id):
+        self.actions[action_id] = replace(self.actions[action_id], status="hecha", completed_at="2025-01-01T00:00:00")
+
+    def count_open_actions(self, note_id):
+        return sum(1 for action in self.actions.values() if action.note_id == note_id and action.status != "hecha")
+
+    def get_actions_by_note(self, note_id):
+        return [action for action in self.actions.values() if action.note_id == note_id]
+
+
+class NotionActionSyncTests(unittest.TestCase):
+    """mark_action_done against in-memory repositories: only the Notion calls and status changes matter."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Prototipos construidos una vez; cada test recibe copias con dataclasses.replace.
+        cls._NOTE = Note(
+            id=1,
+            created_at="2025-01-01T00:00:00",
+            source="manual",
+            source_id="src-1",
+            title="Nota",
+            raw_text="Texto con una tarea",
+            area="Ventas",
+            tipo="Nota",
+            estado="Pendiente",
+            prioridad="Media",
+            fecha="2025-01-01",
+            hora_inicio=None,
+            duracion=None,
+            hora_fin=None,
+            resumen="",
+            acciones="Tarea Notion",
+            status="enviado",
+            notion_page_id="notion-page-123",
+            last_error=None,
+            attempts=0,
+            next_retry_at=None,
+        )
+        cls._ACTION = Action(
+            id=10,
+            note_id=1,
+            description="Tarea Notion",
+            area="Ventas",
+            status="pendiente",
+            created_at="2025-01-01T00:00:00",
+            completed_at=None,
+            notion_page_id="task-page-1",
+        )
+
+        # Patcher de NotionClient compartido por la clase, como en DedupTests.
+        notion_patcher = patch("app.core.service.NotionClient")
+        cls.mock_notion_client = notion_patcher.start()
+        cls.addClassCleanup(notion_patcher.stop)
+
+    def setUp(self):
+        self.mock_notion_client.reset_mock(return_value=True, side_effect=True)
+        note = replace(self._NOTE)
+        action = replace(self._ACTION)
+        self.settings = AppSettings(notion_token="token", notion_enabled=True)
+        self.service = NoteService(
+            _FakeNoteRepo([note]),
+            _FakeSettingsRepo(self.settings),
+            _FakeMastersRepo(),
+            _FakeActionsRepo([action]),
+            outlook_service=object(),
+        )
+
+    def test_mark_action_done_syncs_notion_when_page_is_available(self):
+        self.service.mark_action_done(10)
+
+        self.mock_notion_client.return_value.update_page_status.assert_called_once_with(
+            "task-page-1", *_FINALIZE_ARGS
+        )
+
+    def test_mark_action_done_logs_notion_errors_without_breaking(self):
+        self.mock_notion_client.return_value.update_page_status.side_effect = RuntimeError("boom")
+
+        self.service.mark_action_done(10)
+
+        self.assertEqual(self.service.actions_repo.get_action(10).status, "hecha")
+        self.assertEqual(self.service.note_repo.get_note(1).estado, "Finalizado")
+
+    def test_mark_action_done_closes_parent_note_when_all_tasks_are_done(self):
+        self.settings.notion_database_id = "db"
+        self.mock_notion_client.return_value.count_open_tasks_by_fuente_id.return_value = 0
+
+        self.service.mark_action_done(10)
 
-        temp = Path("tests") / "tmp_test.db"
-        if temp.exists():
-            temp.unlink()
-        return temp
+        self.assertEqual(self.mock_notion_client.return_value.update_page_status.call_count, 2)
 
 
 if __name__ == "__main__":
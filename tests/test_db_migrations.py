@@ -1,6 +1,6 @@
 import sqlite3
 
-from app.persistence.db import guardar_version, obtener_version, run_migrations
+from app.persistence.db import Database, guardar_version, obtener_version, run_migrations
 
 
 def _conn() -> sqlite3.Connection:
@@ -221,3 +221,42 @@ def test_run_migrations_backfills_knowledge_area_tipo_text_from_legacy_ids() ->
     assert item["area"] == "Legacy Area"
     assert item["tipo"] == "Legacy Type"
     assert topic["area"] == "Legacy Area"
+
+
+def test_migrate_crea_indice_parcial_de_acciones_abiertas(tmp_path) -> None:
+    db = Database(tmp_path / "app.db", durable=False)
+    db.migrate()
+    conn = db.connect()
+
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT COUNT(1) FROM actions WHERE note_id = ? AND status != 'hecha'",
+        (1,),
+    ).fetchall()
+
+    assert any("idx_actions_open_by_note" in str(row[3]) for row in plan)
+    conn.close()
+
+
+def test_connect_aplica_pragmas_de_rendimiento(tmp_path) -> None:
+    conn = Database(tmp_path / "app.db").connect()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    conn.close()
+
+    scratch = Database(tmp_path / "scratch.db", durable=False).connect()
+    assert scratch.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+    assert scratch.execute("PRAGMA synchronous").fetchone()[0] == 0
+    scratch.close()
+
+
+def test_migrate_acepta_uri_de_memoria_compartida(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    db = Database("file:nsb_test_uri?mode=memory&cache=shared", durable=False)
+    keeper = db.connect()
+    db.migrate()
+
+    tables = {row[0] for row in keeper.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "notes_local" in tables
+    assert list(tmp_path.iterdir()) == []
+    keeper.close()
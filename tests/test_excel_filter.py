@@ -0,0 +1,97 @@
+from app.ui.excel_filter import ExcelTreeFilter, FilterState
+
+
+class _FakeTree:
+    def bind(self, *_args, **_kwargs) -> None:
+        return None
+
+    def heading(self, *_args, **_kwargs) -> None:
+        return None
+
+
+def _build_filter(rows: list[tuple], applied: list[list[tuple]], cache_rows: bool = True) -> ExcelTreeFilter:
+    return ExcelTreeFilter(
+        master=None,
+        tree=_FakeTree(),
+        columns=("id", "area"),
+        get_rows=lambda: rows,
+        set_rows=applied.append,
+        cache_rows=cache_rows,
+    )
+
+
+def test_filtro_reutiliza_celdas_de_la_misma_lista() -> None:
+    rows = [(1, "Ventas"), (2, "Compras"), (3, "")]
+    applied: list[list[tuple]] = []
+    excel_filter = _build_filter(rows, applied)
+
+    excel_filter.filters["area"] = FilterState(operator="contiene", value1="VEN")
+    excel_filter.apply()
+    cells = excel_filter._cells_by_col["area"]
+    excel_filter.filters["area"] = FilterState(operator="vacías")
+    excel_filter.apply()
+
+    assert applied == [[(1, "Ventas")], [(3, "")]]
+    assert excel_filter._cells_by_col["area"] is cells
+
+
+def test_filtro_sin_cache_recalcula_celdas_en_cada_aplicacion() -> None:
+    rows = [[1, "Ventas"]]
+    applied: list[list] = []
+    excel_filter = _build_filter(rows, applied, cache_rows=False)
+    excel_filter.filters["area"] = FilterState(operator="igual a", value1="compras")
+
+    excel_filter.apply()
+    rows[0][1] = "Compras"
+    excel_filter.apply()
+
+    assert applied == [[], [[1, "Compras"]]]
+
+
+def test_ordenacion_numerica_usa_las_celdas_de_la_columna() -> None:
+    rows = [(10, "b"), (9, "a"), (None, "c")]
+    applied: list[list[tuple]] = []
+    excel_filter = _build_filter(rows, applied)
+
+    excel_filter.set_sort("id", "asc")
+    excel_filter.set_sort("id", "desc")
+
+    assert applied[0] == [(9, "a"), (10, "b"), (None, "c")]
+    assert applied[1] == [(None, "c"), (10, "b"), (9, "a")]
+
+
+def test_filtros_compilados_combinan_varias_columnas() -> None:
+    rows = [(1, "Ventas"), (5, "Ventas norte"), (8, "Compras"), (None, "Ventas")]
+    applied: list[list[tuple]] = []
+    excel_filter = _build_filter(rows, applied)
+    excel_filter.filters["id"] = FilterState(operator="≥", value1="2")
+    excel_filter.filters["area"] = FilterState(operator="empieza por", value1="ven")
+
+    excel_filter.apply()
+
+    assert applied == [[(5, "Ventas norte")]]
+
+
+def test_cabeceras_solo_cambian_texto_cuando_varia_el_titulo() -> None:
+    calls: list[dict] = []
+    tree = _FakeTree()
+    tree.heading = lambda _col, **kwargs: calls.append(kwargs)
+    excel_filter = ExcelTreeFilter(
+        master=None, tree=tree, columns=("id",), get_rows=lambda: [], set_rows=lambda _rows: None
+    )
+    calls.clear()
+
+    excel_filter.apply()
+    excel_filter.set_sort("id", "asc")
+
+    assert calls == [{"text": "id ▲"}]
+
+
+def test_ordenacion_de_texto_mantiene_vacias_al_final() -> None:
+    rows = [(1, "b"), (2, ""), (3, "a"), (4, None)]
+    applied: list[list[tuple]] = []
+    excel_filter = _build_filter(rows, applied)
+
+    excel_filter.set_sort("area", "asc")
+
+    assert [row[0] for row in applied[0]] == [3, 1, 2, 4]
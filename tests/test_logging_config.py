@@ -0,0 +1,35 @@
+import logging
+
+from app.utils.logging_config import configure_logging, stop_logging
+
+
+def test_configure_logging_escribe_en_fichero_desde_el_listener(tmp_path) -> None:
+    root = logging.getLogger()
+    previous_handlers = root.handlers[:]
+    previous_level = root.level
+    try:
+        log_file = configure_logging(tmp_path / "logs")
+        logging.getLogger("prueba").info("mensaje %s", "encolado")
+        assert all(isinstance(handler, logging.handlers.QueueHandler) for handler in root.handlers)
+        stop_logging()
+
+        content = log_file.read_text(encoding="utf-8")
+        assert "[INFO] prueba - mensaje encolado" in content
+    finally:
+        stop_logging()
+        root.handlers[:] = previous_handlers
+        root.setLevel(previous_level)
+
+
+def test_configure_logging_no_crea_el_fichero_hasta_el_primer_registro(tmp_path) -> None:
+    root = logging.getLogger()
+    previous_handlers = root.handlers[:]
+    previous_level = root.level
+    try:
+        log_file = configure_logging(tmp_path / "logs")
+        assert not log_file.exists()
+        stop_logging()
+    finally:
+        stop_logging()
+        root.handlers[:] = previous_handlers
+        root.setLevel(previous_level)
@@ -0,0 +1,703 @@
+from datetime import datetime
+import queue
+import random
+import sys
+import tkinter
+import types
+
+import pytest
+
+# Stubs to import main_window without optional deps.
+google = types.ModuleType("google")
+auth = types.ModuleType("google.auth")
+transport = types.ModuleType("google.auth.transport")
+requests = types.ModuleType("google.auth.transport.requests")
+requests.Request = object
+oauth2 = types.ModuleType("google.oauth2")
+credentials = types.ModuleType("google.oauth2.credentials")
+credentials.Credentials = object
+oauthlib = types.ModuleType("google_auth_oauthlib")
+flow = types.ModuleType("google_auth_oauthlib.flow")
+flow.InstalledAppFlow = object
+apiclient = types.ModuleType("googleapiclient")
+discovery = types.ModuleType("googleapiclient.discovery")
+discovery.build = lambda *args, **kwargs: None
+
+sys.modules.setdefault("google", google)
+sys.modules.setdefault("google.auth", auth)
+sys.modules.setdefault("google.auth.transport", transport)
+sys.modules.setdefault("google.auth.transport.requests", requests)
+sys.modules.setdefault("google.oauth2", oauth2)
+sys.modules.setdefault("google.oauth2.credentials", credentials)
+sys.modules.setdefault("google_auth_oauthlib", oauthlib)
+sys.modules.setdefault("google_auth_oauthlib.flow", flow)
+sys.modules.setdefault("googleapiclient", apiclient)
+sys.modules.setdefault("googleapiclient.discovery", discovery)
+
+# tkcalendar stub
+calendar_mod = types.ModuleType("tkcalendar")
+calendar_mod.DateEntry = object
+sys.modules.setdefault("tkcalendar", calendar_mod)
+
+from app.ui.main_window import MainWindow, _drain_queue, _read_string_vars, _sync_tree_rows
+
+
+class _FakeTree:
+    def __init__(self) -> None:
+        self.items: dict[str, tuple] = {}
+        self.order: list[str] = []
+        self.calls: list[str] = []
+
+    def delete(self, *iids: str) -> None:
+        self.calls.append("delete")
+        for iid in iids:
+            self.items.pop(iid)
+            if iid in self.order:
+                self.order.remove(iid)
+
+    @property
+    def tk(self) -> tkinter.Tcl:
+        # Intérprete Tcl real: el script de altas se evalúa de verdad contra ".tree".
+        if self._tcl is None:
+            self._tcl = tkinter.Tcl()
+            self._tcl.createcommand(self._w, self._tcl_command)
+        return self._tcl
+
+    _w = ".tree"
+    _tcl = None
+
+    def _tcl_command(self, command: str, _parent: str, _index: str, _id_opt: str, iid: str, _values_opt: str, values: str) -> None:
+        assert command == "insert"
+        self.calls.append("insert")
+        self.items[iid] = tuple(self._tcl.splitlist(values))
+        self.order.append(iid)
+
+    def item(self, iid: str, values: tuple) -> None:
+        self.calls.append("item")
+        self.items[iid] = values
+
+    def get_children(self) -> tuple[str, ...]:
+        return tuple(self.order)
+
+    def detach(self, *iids: str) -> None:
+        self.calls.append("detach")
+        for iid in iids:
+            self.order.remove(iid)
+
+    def move(self, iid: str, _parent: str, index: int) -> None:
+        self.calls.append("move")
+        if iid in self.order:
+            self.order.remove(iid)
+        self.order.insert(index, iid)
+
+
+def test_sync_tree_rows_solo_toca_filas_cambiadas() -> None:
+    tree = _FakeTree()
+    rendered: dict[str, tuple] = {}
+    _sync_tree_rows(tree, [(1, "a"), (2, "b"), (3, "c")], "a", rendered)
+    tree.calls.clear()
+
+    _sync_tree_rows(tree, [(1, "a"), (2, "b"), (3, "c")], "a", rendered)
+    assert tree.calls == []
+
+    _sync_tree_rows(tree, [(4, "d"), (1, "a"), (3, "c2")], "a", rendered)
+    assert tree.calls.count("delete") == 1
+    assert tree.calls.count("insert") == 1
+    assert tree.calls.count("item") == 1
+    assert tree.order == ["a4", "a1", "a3"]
+    assert tree.items["a3"] == (3, "c2")
+    assert tree.items["a4"] == ("4", "d")
+    assert set(rendered) == {"a4", "a1", "a3"}
+
+
+def test_sync_tree_rows_solo_mueve_las_filas_que_cambian_de_posicion() -> None:
+    tree = _FakeTree()
+    rendered: dict[str, tuple] = {}
+    rows = [(i, f"v{i}") for i in range(1000)]
+    _sync_tree_rows(tree, rows, "a", rendered)
+    tree.calls.clear()
+
+    rows.insert(500, (5000, "nueva"))
+    _sync_tree_rows(tree, rows, "a", rendered)
+    assert tree.calls == ["insert", "move"]
+    assert tree.order == [f"a{row[0]}" for row in rows]
+
+    tree.calls.clear()
+    rows[10], rows[20] = rows[20], rows[10]
+    _sync_tree_rows(tree, rows, "a", rendered)
+    assert tree.calls.count("move") == 2
+    assert tree.order == [f"a{row[0]}" for row in rows]
+
+    # Cualquier permutación parcial acaba en el orden pedido: ocultar, reinsertar y mover a la vez.
+    all_rows = list(rows)
+    rng = random.Random(7)
+    for _ in range(20):
+        rows = rng.sample(all_rows, len(all_rows) - 5)
+        _sync_tree_rows(tree, rows, "a", rendered, all_rows)
+        assert tree.order == [f"a{row[0]}" for row in rows]
+
+
+def test_sync_tree_rows_oculta_filas_filtradas_sin_borrarlas() -> None:
+    tree = _FakeTree()
+    rendered: dict[str, tuple] = {}
+    all_rows = [(1, "a"), (2, "b"), (3, "c")]
+    _sync_tree_rows(tree, all_rows, "a", rendered, all_rows)
+    tree.calls.clear()
+
+    _sync_tree_rows(tree, [(3, "c")], "a", rendered, all_rows)
+    assert tree.order == ["a3"]
+    assert "delete" not in tree.calls and "insert" not in tree.calls
+
+    tree.calls.clear()
+    _sync_tree_rows(tree, [(1, "a"), (3, "c")], "a", rendered, [(1, "a"), (3, "c")])
+    assert tree.order == ["a1", "a3"]
+    assert "insert" not in tree.calls
+    assert set(rendered) == {"a1", "a3"}
+    assert "a2" not in tree.items
+
+
+def test_poll_queue_aplica_datos_cargados_en_segundo_plano() -> None:
+    note = types.SimpleNamespace(id=7)
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._notes_limit = 200
+    window._reader_service = types.SimpleNamespace(
+        list_notes=lambda limit: [note], list_pending_actions=lambda: ["accion"]
+    )
+    refreshed: list[str] = []
+    window.refresh_notes = lambda: refreshed.append("notes")
+    window.refresh_actions = lambda: refreshed.append("actions")
+    window.after = lambda *_args: None
+    idle: list = []
+    window.after_idle = idle.append
+    window._refresh_scheduled = False
+    window._refresh_targets = set()
+    window._poll_interval_ms = 150
+    window._load_generation = 1
+
+    window._refresh_notes_worker(1, 200)
+    window._refresh_actions_worker(1)
+    window._poll_queue()
+    assert refreshed == []
+    assert len(idle) == 1
+    idle.pop()()
+
+    assert window._notes_cache == {7: note}
+    assert window._actions_cache == ["accion"]
+    assert refreshed == ["notes", "actions"]
+    assert window._refresh_scheduled is False
+
+
+def test_poll_queue_agrupa_refrescos_de_una_rafaga() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window.status_var = types.SimpleNamespace(set=lambda _value: None)
+    calls: list[str] = []
+    window.refresh_notes = lambda: calls.append("notes")
+    window.refresh_actions = lambda: calls.append("actions")
+    window._refresh_data_async = lambda: calls.append("reload")
+    window.after = lambda *_args: None
+    window.after_idle = lambda callback: callback()
+    window._refresh_scheduled = False
+    window._refresh_targets = set()
+    window._poll_interval_ms = 150
+    window._load_generation = 3
+    for kind, payload in (("notes_data", (3, [], False)), ("notes_data", (3, [], False)), ("status", ""), ("status", "")):
+        window.msg_queue.put((kind, payload))
+
+    window._poll_queue()
+
+    assert calls == ["notes"]
+
+
+def test_drain_queue_vacia_la_cola_en_orden() -> None:
+    pending: queue.Queue = queue.Queue()
+    for item in ("a", "b", "c"):
+        pending.put(item)
+
+    assert _drain_queue(pending) == ["a", "b", "c"]
+    assert pending.empty()
+
+
+def test_refresh_notes_no_repinta_si_los_datos_no_cambian() -> None:
+    note = types.SimpleNamespace(id=1, title="t", status="pendiente", last_error=None, notion_page_id=None)
+    window = MainWindow.__new__(MainWindow)
+    window.notes_data = []
+    window._shared_strings = {}
+    window._notes_cache = {1: note}
+    applied: list[list[tuple]] = []
+    window.apply_note_filters = lambda: applied.append(window.notes_data)
+
+    window.refresh_notes()
+    window.refresh_notes()
+
+    assert applied == [[(1, "t", "pendiente", "", "")]]
+
+
+def test_poll_queue_espacia_el_sondeo_sin_mensajes() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._poll_interval_ms = 150
+    delays: list[int] = []
+    window.after = lambda delay, _callback: delays.append(delay)
+
+    for _ in range(5):
+        window._poll_queue()
+    window.msg_queue.put(("status", "ok"))
+    window.status_var = types.SimpleNamespace(set=lambda _value: None)
+    window._poll_queue()
+
+    assert delays == [300, 600, 1000, 1000, 1000, 20]
+
+
+def test_refresh_notes_precalcula_urls_de_notion() -> None:
+    note = types.SimpleNamespace(id=3, title="t", status="enviada", last_error=None, notion_page_id="ab-cd")
+    window = MainWindow.__new__(MainWindow)
+    window.notes_data = []
+    window._shared_strings = {}
+    window._notes_cache = {3: note}
+    window.apply_note_filters = lambda: None
+
+    window.refresh_notes()
+
+    assert window._note_urls == {3: "https://www.notion.so/abcd"}
+
+
+def test_fill_actions_tree_carga_filas_por_tramos() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.actions_tree = _FakeTree()
+    window._actions_rendered = {}
+    window._actions_visible = []
+    window._actions_fill_after_id = None
+    window.actions_data = [(i, "area", "desc", "pendiente", 1, "") for i in range(260)]
+    pending: list[tuple] = []
+    window.after_idle = lambda callback, *args: pending.append((callback, args)) or "after#1"
+
+    window._refresh_actions_tree(window.actions_data)
+    assert len(window.actions_tree.order) == 200
+
+    while pending:
+        callback, args = pending.pop(0)
+        callback(*args)
+
+    assert len(window.actions_tree.order) == 260
+    assert window._actions_fill_after_id is None
+
+
+def test_refresh_actions_con_una_fila_cambiada_no_mueve_las_demas() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.actions_tree = _FakeTree()
+    window._actions_rendered = {}
+    window._actions_visible = []
+    window._actions_fill_after_id = None
+    window.actions_data = [(i, "area", "desc", "pendiente", 1, "") for i in range(1000)]
+    pending: list[tuple] = []
+    window.after_idle = lambda callback, *args: pending.append((callback, args)) or "after#1"
+
+    def _drain() -> None:
+        while pending:
+            callback, args = pending.pop(0)
+            callback(*args)
+
+    window._refresh_actions_tree(window.actions_data)
+    _drain()
+    window.actions_tree.calls.clear()
+
+    window.actions_data = list(window.actions_data)
+    window.actions_data[700] = (700, "area", "desc", "hecha", 1, "")
+    window._refresh_actions_tree(window.actions_data)
+    _drain()
+
+    assert window.actions_tree.calls == ["item"]
+    assert len(window.actions_tree.order) == 1000
+
+
+def test_refresh_actions_comparte_cadenas_de_area_y_estado() -> None:
+    actions = [
+        types.SimpleNamespace(id=i, area="".join(["Ven", "tas"]), description="d", status="pendiente", note_id=1, notion_page_id=None)
+        for i in range(2)
+    ]
+    window = MainWindow.__new__(MainWindow)
+    window.actions_data = []
+    window._shared_strings = {}
+    window._actions_cache = actions
+    window.apply_filters = lambda: None
+
+    window.refresh_actions()
+
+    assert window.actions_data[0][1] is window.actions_data[1][1]
+
+
+def test_poll_queue_muestra_resultados_sin_dialogos_modales() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._poll_interval_ms = 150
+    window.status_var = types.SimpleNamespace(set=lambda _value: None)
+    window.after = lambda *_args: None
+    window._refresh_data_async = lambda: None
+    toasts: list[tuple[str, bool]] = []
+    window._show_toast = lambda message, error=False: toasts.append((message, error))
+    window.msg_queue.put(("info", "Sincronización completada"))
+    window.msg_queue.put(("error", "fallo"))
+
+    window._poll_queue()
+
+    assert toasts == [("Sincronización completada", False), ("fallo", True)]
+
+
+def test_sync_tree_rows_sin_cambios_no_llama_a_tk() -> None:
+    tree = _FakeTree()
+    rendered: dict[str, tuple] = {}
+    visible: list[str] = []
+    all_rows = [(1, "a"), (2, "b"), (3, "c")]
+    _sync_tree_rows(tree, all_rows, "", rendered, all_rows, visible)
+    _sync_tree_rows(tree, [(3, "c"), (1, "a")], "", rendered, all_rows, visible)
+    assert tree.order == visible == ["3", "1"]
+
+    tree.calls.clear()
+    tree.get_children = None
+    _sync_tree_rows(tree, [(3, "c"), (1, "a")], "", rendered, all_rows, visible)
+    assert tree.calls == []
+
+
+class _InlineExecutor:
+    """Executor that runs each submitted call at once, in the calling thread."""
+
+    def __init__(self) -> None:
+        self.submitted: list = []
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        self.submitted.append(fn)
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+def test_post_message_solo_encola_y_el_sondeo_se_programa_desde_tk() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._poll_interval_ms = 1000
+    window._poll_after_id = "after#pending"
+    scheduled: list[tuple] = []
+    cancelled: list[str] = []
+    window.after = lambda delay, callback: scheduled.append((delay, callback)) or f"after#{len(scheduled)}"
+    window.after_cancel = cancelled.append
+
+    window._post_message("status", "Sincronizando")
+    assert scheduled == [] and cancelled == []
+
+    window._executor = _InlineExecutor()
+    window._submit_background(window._post_message, "status", "Listo")
+
+    assert cancelled == ["after#pending"]
+    assert scheduled == [(20, window._poll_queue)]
+    assert window._poll_after_id == "after#1"
+    assert window._poll_interval_ms == 20
+    assert window.msg_queue.qsize() == 2
+
+
+def test_refresh_data_async_descarta_resultados_de_recargas_anteriores() -> None:
+    old_note = types.SimpleNamespace(id=1)
+    new_note = types.SimpleNamespace(id=2)
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._poll_interval_ms = 150
+    window._poll_after_id = None
+    window._notes_limit = 200
+    window._load_generation = 0
+    window.after = lambda *_args: "after#1"
+    window.after_cancel = lambda _after_id: None
+    window.after_idle = lambda callback: None
+    window._refresh_scheduled = False
+    window._refresh_targets = set()
+    window._executor = _InlineExecutor()
+    window._reader_service = types.SimpleNamespace(
+        list_notes=lambda limit: [new_note], list_pending_actions=lambda: ["nueva"]
+    )
+
+    window._refresh_data_async()
+    # Una carga lenta de la recarga anterior llega después de la actual y no debe pisarla.
+    window._post_message("notes_data", (0, [old_note], False))
+    window._post_message("actions_data", (0, ["vieja"]))
+    window._poll_queue()
+
+    assert window._executor.submitted == [window._refresh_notes_worker, window._refresh_actions_worker]
+    assert window._notes_cache == {2: new_note}
+    assert window._actions_cache == ["nueva"]
+
+
+def test_find_note_usa_las_notas_pintadas_y_consulta_solo_si_falta() -> None:
+    cached = types.SimpleNamespace(id=1)
+    fetched = types.SimpleNamespace(id=2)
+    window = MainWindow.__new__(MainWindow)
+    window._notes_by_id = {1: cached}
+    lookups: list[int] = []
+    window.service = types.SimpleNamespace(get_note_by_id=lambda note_id: lookups.append(note_id) or fetched)
+
+    assert window._find_note(1) is cached
+    assert window._find_note(2) is fetched
+    assert lookups == [2]
+
+
+def test_abrir_evento_google_lee_el_enlace_de_sqlite_y_no_de_la_cache(monkeypatch) -> None:
+    window = MainWindow.__new__(MainWindow)
+    window._notes_by_id = {1: types.SimpleNamespace(id=1, google_calendar_link="")}
+    stored = types.SimpleNamespace(id=1, google_calendar_link="https://calendar.google.com/event?eid=1")
+    window.service = types.SimpleNamespace(get_note_by_id=lambda _note_id: stored)
+    window.tree = types.SimpleNamespace(selection=lambda: ("1",), item=lambda _iid, _option: ("1",))
+    opened: list[str] = []
+    monkeypatch.setattr("app.ui.main_window.webbrowser.open", opened.append)
+
+    window._open_selected_note_google_event()
+
+    assert opened == [stored.google_calendar_link]
+
+
+def test_maestros_cargados_en_segundo_plano_llegan_por_la_cola() -> None:
+    masters = {"Area": ["General"], "Tipo": ["Nota"], "Estado": ["Pendiente"], "Prioridad": ["Media"]}
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._poll_interval_ms = 150
+    window._reader_service = types.SimpleNamespace(
+        get_master_values_bulk=lambda _categories: masters, invalidate_master_values=lambda: None
+    )
+    window.status_var = types.SimpleNamespace(set=lambda _value: None)
+    window.after = lambda *_args: None
+    loaded: list[dict] = []
+    window._load_master_values = lambda: loaded.append(window._master_cache)
+
+    window._load_masters_worker()
+    window._poll_queue()
+
+    assert loaded == [masters]
+
+
+def test_scroll_al_final_pide_la_siguiente_pagina_de_notas() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window.msg_queue = queue.Queue()
+    window._poll_interval_ms = 150
+    window._notes_limit = 2
+    window._load_generation = 1
+    window._executor = _InlineExecutor()
+    window._poll_after_id = None
+    window.after_cancel = lambda _after_id: None
+    window._notes_page_loading = False
+    window._notes_has_more = True
+    window._notes_user_scrolled = False
+    window._notes_cache = {5: types.SimpleNamespace(id=5), 4: types.SimpleNamespace(id=4)}
+    window.after = lambda *_args: None
+    pages: list[tuple[int, int]] = []
+    older = [types.SimpleNamespace(id=3)]
+    window._reader_service = types.SimpleNamespace(
+        list_notes=lambda limit, offset: pages.append((limit, offset)) or older
+    )
+    window.refresh_notes = lambda: None
+    window.after_idle = lambda callback: callback()
+    window._refresh_scheduled = False
+    window._refresh_targets = set()
+
+    # Una vista corta o filtrada informa 1.0 en cada repintado: sin desplazamiento del usuario no pagina.
+    window._on_notes_yview("0.0", "1.0")
+    window._mark_notes_user_scroll()
+    window._on_notes_yview("0.5", "0.9")
+    assert pages == []
+
+    window._mark_notes_user_scroll()
+    window._on_notes_yview("0.5", "1.0")
+    window._on_notes_yview("0.5", "1.0")
+    window._poll_queue()
+
+    assert pages == [(200, 2)]
+    assert list(window._notes_cache) == [5, 4, 3]
+    assert window._notes_page_loading is False
+
+    # La página llegó incompleta: no quedan más notas que pedir.
+    window._mark_notes_user_scroll()
+    window._on_notes_yview("0.5", "1.0")
+    assert pages == [(200, 2)]
+
+
+def test_read_string_vars_lee_todas_las_variables_de_una_vez() -> None:
+    interp = tkinter.Tcl()
+    values = ["Título con espacios", "", "{llaves} y $dólar", "línea\nnueva"]
+    variables = [tkinter.StringVar(master=interp, value=value) for value in values]
+
+    assert _read_string_vars(interp, variables) == tuple(values)
+
+
+def test_enviar_no_encola_otra_sincronizacion_mientras_hay_una_en_curso() -> None:
+    from concurrent.futures import Future
+
+    class _RecordingExecutor:
+        def __init__(self) -> None:
+            self.submitted: list = []
+
+        def submit(self, fn, *_args):
+            self.submitted.append(fn)
+            return Future()
+
+    window = MainWindow.__new__(MainWindow)
+    window.service = types.SimpleNamespace(is_notion_enabled=lambda: True)
+    statuses: list[str] = []
+    window.status_var = types.SimpleNamespace(set=statuses.append)
+    window._executor = _RecordingExecutor()
+    window._notion_executor = _RecordingExecutor()
+    window._sync_future = None
+    window._poll_after_id = None
+    window.after = lambda *_args: "after#1"
+    window.after_cancel = lambda _after_id: None
+
+    window._sync()
+    window._sync()
+    assert window._notion_executor.submitted == [window._sync_worker]
+    assert statuses == ["Sincronización en curso..."]
+    # Las recargas usan el otro hilo y no quedan en cola detrás de la sincronización.
+    assert window._executor.submitted == []
+
+    window._sync_future.set_result(None)
+    window._sync()
+    assert len(window._notion_executor.submitted) == 2
+
+
+def test_cada_hilo_de_fondo_abre_su_propio_servicio() -> None:
+    import threading
+
+    window = MainWindow.__new__(MainWindow)
+    window._service_factory = lambda: threading.current_thread().name
+    executor = window._build_executor("nsb-test", "_reader_service")
+    try:
+        executor.submit(lambda: None).result()
+    finally:
+        executor.shutdown()
+
+    assert window._reader_service.startswith("nsb-test")
+
+
+def test_guardar_nota_confirma_sin_dialogo_modal(monkeypatch) -> None:
+    interp = tkinter.Tcl()
+    window = MainWindow.__new__(MainWindow)
+    window.tk = interp
+    for name, value in (
+        ("title_var", "Título"),
+        ("source_var", "manual"),
+        ("area_var", "General"),
+        ("tipo_var", "Nota"),
+        ("estado_var", "Pendiente"),
+        ("prioridad_var", "Media"),
+        ("hora_inicio_var", ""),
+        ("duracion_var", "60 min"),
+        ("hora_fin_var", ""),
+    ):
+        setattr(window, name, tkinter.StringVar(master=interp, value=value))
+    window.text_widget = types.SimpleNamespace(get=lambda *_args: "texto", delete=lambda *_args: None)
+    window.date_entry = types.SimpleNamespace(get_date=lambda: datetime(2024, 1, 2).date())
+    window.service = types.SimpleNamespace(create_note=lambda _req: (1, "Nota guardada"))
+    statuses: list[str] = []
+    window.status_var = types.SimpleNamespace(set=statuses.append)
+    toasts: list[str] = []
+    window._show_toast = lambda message, error=False: toasts.append(message)
+    window._refresh_data_async = lambda: None
+    window._calendar_window = None
+    monkeypatch.setattr(
+        "app.ui.main_window.messagebox.showinfo",
+        lambda *_args: pytest.fail("no debe abrir un diálogo modal"),
+    )
+
+    window._save_note()
+
+    assert statuses == ["Nota guardada"]
+    assert toasts == ["Nota guardada"]
+    assert window.title_var.get() == ""
+
+
+def test_set_combo_values_no_reconfigura_si_no_cambian() -> None:
+    class _FakeCombo:
+        def __init__(self) -> None:
+            self.configured: list[tuple[str, ...]] = []
+
+        def __str__(self) -> str:
+            return ".form.area"
+
+        def configure(self, values) -> None:
+            self.configured.append(values)
+
+    window = MainWindow.__new__(MainWindow)
+    window._combo_values = {}
+    combo = _FakeCombo()
+
+    window._set_combo_values(combo, ["General", "Ventas"])
+    window._set_combo_values(combo, ["General", "Ventas"])
+    window._set_combo_values(combo, ["General"])
+
+    assert combo.configured == [("General", "Ventas"), ("General",)]
+
+
+def test_marcar_accion_hecha_recarga_en_segundo_plano_sin_vaciar_las_listas() -> None:
+    notes = {1: types.SimpleNamespace(id=1)}
+    window = MainWindow.__new__(MainWindow)
+    window.actions_tree = types.SimpleNamespace(selection=lambda: ("7",), item=lambda _iid, _option: ("7",))
+    window.service = types.SimpleNamespace(mark_action_done=lambda _action_id: None)
+    window._process_completion_event = lambda _completion: None
+    window.status_var = types.SimpleNamespace(set=lambda _value: None)
+    window._calendar_window = None
+    window._notes_cache = notes
+    window._actions_cache = ["pendiente"]
+    reloads: list[str] = []
+    window._refresh_data_async = lambda: reloads.append("reload")
+    window.refresh_actions = lambda: pytest.fail("no debe leer SQLite desde el hilo de Tk")
+
+    window._mark_selected_action_done()
+
+    assert reloads == ["reload"]
+    assert window._notes_cache is notes
+    assert window._actions_cache == ["pendiente"]
+
+
+def test_refrescar_sin_datos_cargados_no_consulta_sqlite() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window._notes_cache = None
+    window._actions_cache = None
+    window.service = types.SimpleNamespace()
+
+    window.refresh_notes()
+    window.refresh_actions()
+
+
+def test_maestros_recibidos_solo_rellenan_los_combos_sin_valor() -> None:
+    interp = tkinter.Tcl()
+    window = MainWindow.__new__(MainWindow)
+    window._combo_values = {}
+    window._master_cache = {
+        "Area": ["General", "Ventas"],
+        "Tipo": ["Nota", "Evento"],
+        "Estado": ["Abierto", "Pendiente"],
+        "Prioridad": [],
+    }
+    for name in ("area", "tipo", "estado", "prioridad"):
+        setattr(window, f"{name}_combo", types.SimpleNamespace(configure=lambda **_kwargs: None))
+    window.area_var = tkinter.StringVar(master=interp, value="Ventas")
+    window.tipo_var = tkinter.StringVar(master=interp, value="Cargando…")
+    window.estado_var = tkinter.StringVar(master=interp, value="")
+    window.prioridad_var = tkinter.StringVar(master=interp, value="Cargando…")
+    window._toggle_event_time_fields = lambda: None
+
+    window._load_master_values()
+
+    assert window.area_var.get() == "Ventas"
+    assert window.tipo_var.get() == "Nota"
+    assert window.estado_var.get() == "Pendiente"
+    assert window.prioridad_var.get() == ""
+
+
+def test_cambio_de_maestros_los_relee_en_segundo_plano() -> None:
+    window = MainWindow.__new__(MainWindow)
+    window._master_cache = {"Area": ["General"]}
+    loads: list[str] = []
+    window._load_masters_async = lambda: loads.append("async")
+    window.service = types.SimpleNamespace()
+
+    window._on_masters_changed()
+
+    assert loads == ["async"]
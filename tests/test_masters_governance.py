@@ -1,18 +1,38 @@
 import unittest
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
 from app.core.models import AppSettings
 from app.core.service import NoteService
-from app.persistence.db import Database
 from app.persistence.masters_repository import MastersRepository
 from app.persistence.repositories import ActionsRepository, NoteRepository, SettingsRepository
 
+from db_helpers import migrated_connection
+
 
 class MastersGovernanceTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        def _select(*options):
+            return MappingProxyType({"select": MappingProxyType({"options": tuple(options)})})
+
+        # Esquema de solo lectura compartido: además comprueba que la sincronización no lo muta.
+        cls._SCHEMA_FIXTURE = MappingProxyType(
+            {
+                "properties": MappingProxyType(
+                    {
+                        "Area": _select(MappingProxyType({"name": "General", "color": "green"})),
+                        "Tipo": _select(),
+                        "Prioridad": _select(),
+                        "Origen": _select(),
+                        "Estado": _select(MappingProxyType({"name": "Pendiente", "color": "blue"})),
+                    }
+                )
+            }
+        )
+
     def setUp(self):
-        self.db = Database(DatabasePathHelper.path())
-        self.db.migrate()
-        self.conn = self.db.connect()
+        self.conn = migrated_connection()
         self.service = NoteService(
             NoteRepository(self.conn),
             SettingsRepository(self.conn),
@@ -44,21 +64,38 @@ class MastersGovernanceTests(unittest.TestCase):
         active_areas = self.service.get_master_values("Area")
         self.assertNotIn("General", active_areas)
 
+    def test_get_master_values_bulk_matches_per_category_lookup(self):
+        self.service.add_master("Area", "Ventas")
+        self.service.deactivate_master("Area", "General")
+
+        bulk = self.service.get_master_values_bulk(["Area", "Estado", "Inexistente"])
+
+        self.assertEqual(bulk["Area"], self.service.get_master_values("Area"))
+        self.assertEqual(bulk["Estado"], self.service.get_master_values("Estado"))
+        self.assertEqual(bulk["Inexistente"], [])
+
+    def test_master_values_are_cached_until_mutation(self):
+        first = self.service.get_master_values("Area")
+
+        with patch.object(self.service.masters_repo, "list_active", wraps=self.service.masters_repo.list_active) as spy:
+            self.assertEqual(self.service.get_master_values("Area"), first)
+            spy.assert_not_called()
+
+            self.service.add_master("Area", "Compras")
+            self.assertIn("Compras", self.service.get_master_values("Area"))
+            spy.assert_called_once_with("Area")
+
+            self.service.deactivate_master("Area", "Compras")
+            self.assertNotIn("Compras", self.service.get_master_values("Area"))
+            self.assertEqual(spy.call_count, 2)
+
     @patch("app.core.service.NotionClient")
     def test_sync_schema_uses_active_values_and_skips_estado(self, mock_notion_client):
         self.service.add_master("Area", "Ventas")
         self.service.save_settings(AppSettings(notion_token="token", notion_database_id="db", notion_enabled=True))
 
         mock_client = MagicMock()
-        mock_client.get_database_schema.return_value = {
-            "properties": {
-                "Area": {"select": {"options": [{"name": "General", "color": "green"}]}},
-                "Tipo": {"select": {"options": []}},
-                "Prioridad": {"select": {"options": []}},
-                "Origen": {"select": {"options": []}},
-                "Estado": {"select": {"options": [{"name": "Pendiente", "color": "blue"}]}},
-            }
-        }
+        mock_client.get_database_schema.return_value = self._SCHEMA_FIXTURE
         mock_notion_client.return_value = mock_client
 
         self.service.sync_schema_with_notion()
@@ -71,16 +108,5 @@ class MastersGovernanceTests(unittest.TestCase):
         self.assertNotIn("Estado", payload)
 
 
-class DatabasePathHelper:
-    @staticmethod
-    def path():
-        from pathlib import Path
-
-        temp = Path("tests") / "tmp_masters_test.db"
-        if temp.exists():
-            temp.unlink()
-        return temp
-
-
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,36 @@
-import unittest
-from unittest.mock import patch
+from dataclasses import replace
+
+import pytest
+import requests
 
 from app.core.models import AppSettings, Note
 from app.integrations.notion_client import NotionClient
 
+_SETTINGS = AppSettings(notion_token="token", notion_database_id="db")
+_BASE_NOTE = Note(
+    id=1,
+    created_at="2025-01-01T00:00:00",
+    source="manual",
+    source_id="src",
+    title="",
+    raw_text="Texto original",
+    area="Área",
+    tipo="Nota",
+    estado="Pendiente",
+    prioridad="Media",
+    fecha="2025-01-01",
+    hora_inicio=None,
+    duracion=None,
+    hora_fin=None,
+    resumen="",
+    acciones="",
+    status="pendiente",
+    notion_page_id=None,
+    last_error=None,
+    attempts=0,
+    next_retry_at=None,
+)
+
 
 class _DummyResponse:
     def __init__(self, status_code=200, body=None):
@@ -15,98 +42,101 @@ class _DummyResponse:
         return self._body
 
 
-class NotionClientCreatePageTests(unittest.TestCase):
-    def setUp(self):
-        self.client = NotionClient("token")
-        self.settings = AppSettings(notion_token="token", notion_database_id="db")
-
-    def _build_note(self, title: str) -> Note:
-        return Note(
-            id=1,
-            created_at="2025-01-01T00:00:00",
-            source="manual",
-            source_id="src",
-            title=title,
-            raw_text="Texto original",
-            area="Área",
-            tipo="Nota",
-            estado="Pendiente",
-            prioridad="Media",
-            fecha="2025-01-01",
-            hora_inicio=None,
-            duracion=None,
-            hora_fin=None,
-            resumen="",
-            acciones="",
-            status="pendiente",
-            notion_page_id=None,
-            last_error=None,
-            attempts=0,
-            next_retry_at=None,
-        )
-
-    @patch("requests.post")
-    def test_create_page_uses_note_title_limited_to_200_chars(self, mock_post):
-        mock_post.return_value = _DummyResponse()
-        long_title = "A" * 250
-
-        self.client.create_page("db", self.settings, self._build_note(long_title))
-
-        payload = mock_post.call_args.kwargs["json"]
-        content = payload["properties"][self.settings.prop_title]["title"][0]["text"]["content"]
-        self.assertEqual(content, "A" * 200)
-
-    @patch("requests.post")
-    def test_create_page_uses_default_title_when_empty(self, mock_post):
-        mock_post.return_value = _DummyResponse()
-
-        self.client.create_page("db", self.settings, self._build_note("   "))
-
-        payload = mock_post.call_args.kwargs["json"]
-        content = payload["properties"][self.settings.prop_title]["title"][0]["text"]["content"]
-        self.assertEqual(content, "Sin título")
-
-    @patch("requests.post")
-    def test_create_task_from_action_builds_expected_payload(self, mock_post):
-        mock_post.return_value = _DummyResponse(body={"id": "task_1"})
-        note = self._build_note("Nota madre")
-
-        self.client.create_task_from_action(self.settings, "  Hacer seguimiento con cliente  ", note)
-
-        payload = mock_post.call_args.kwargs["json"]
-        properties = payload["properties"]
-        self.assertEqual(payload["parent"]["database_id"], self.settings.notion_database_id)
-        self.assertEqual(properties[self.settings.prop_tipo]["select"]["name"], "Tarea")
-        self.assertEqual(properties[self.settings.prop_estado]["select"]["name"], "Pendiente")
-        self.assertEqual(properties[self.settings.prop_area]["select"]["name"], note.area)
-        self.assertEqual(properties[self.settings.prop_fecha]["date"]["start"], note.fecha)
-        self.assertEqual(properties["Origen"]["select"]["name"], "Sistema")
-        self.assertEqual(properties["Fuente_ID"]["rich_text"][0]["text"]["content"], str(note.source_id))
-        self.assertEqual(properties["Raw"]["rich_text"][0]["text"]["content"], "Hacer seguimiento con cliente")
-        self.assertEqual(properties[self.settings.prop_prioridad]["select"]["name"], note.prioridad)
-
-
-
-    @patch("requests.patch")
-    def test_update_page_status_uses_estado_property(self, mock_patch):
-        mock_patch.return_value = _DummyResponse(body={"id": "page_1"})
-
-        self.client.update_page_status("page_1", "Finalizado")
-
-        self.assertEqual(
-            mock_patch.call_args.args[0],
-            "https://api.notion.com/v1/pages/page_1",
-        )
-        self.assertEqual(
-            mock_patch.call_args.kwargs["json"],
-            {
-                "properties": {
-                    "Estado": {
-                        "select": {"name": "Finalizado"}
-                    }
-                }
-            },
-        )
-
-if __name__ == "__main__":
-    unittest.main()
+# Respuestas de solo lectura compartidas por todos los tests.
+_OK_RESPONSE = _DummyResponse()
+_TASK_RESPONSE = _DummyResponse(body={"id": "task_1"})
+
+
+def _build_note(title: str) -> Note:
+    return replace(_BASE_NOTE, title=title)
+
+
+def _rich_text(content: str) -> dict:
+    return {"rich_text": [{"text": {"content": content}, "type": "text"}]}
+
+
+def _expected_page_payload(title: str) -> dict:
+    """Full create_page payload for ``_build_note(...)`` with the given resulting title."""
+    return {
+        "parent": {"database_id": "db"},
+        "properties": {
+            _SETTINGS.prop_title: {"title": [{"text": {"content": title}}]},
+            _SETTINGS.prop_area: {"select": {"name": _BASE_NOTE.area}},
+            _SETTINGS.prop_tipo: {"select": {"name": _BASE_NOTE.tipo}},
+            _SETTINGS.prop_estado: {"select": {"name": _BASE_NOTE.estado}},
+            _SETTINGS.prop_fecha: {"date": {"start": _BASE_NOTE.fecha}},
+            _SETTINGS.prop_prioridad: {"select": {"name": _BASE_NOTE.prioridad}},
+        },
+        "children": [
+            {"object": "block", "type": "heading_3", "heading_3": _rich_text(_BASE_NOTE.raw_text)},
+            {"object": "block", "type": "paragraph", "paragraph": _rich_text(_BASE_NOTE.raw_text)},
+        ],
+    }
+
+
+@pytest.fixture
+def client() -> NotionClient:
+    return NotionClient("token")
+
+
+class _HttpCapture:
+    """Stand-in for requests.post/patch that records (args, kwargs) and returns ``response``."""
+
+    def __init__(self):
+        self.calls: list[tuple[tuple, dict]] = []
+        self.response = _OK_RESPONSE
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.response
+
+
+@pytest.fixture
+def http(monkeypatch: pytest.MonkeyPatch) -> _HttpCapture:
+    capture = _HttpCapture()
+    monkeypatch.setattr(requests, "post", capture)
+    monkeypatch.setattr(requests, "patch", capture)
+    return capture
+
+
+def test_create_page_uses_note_title_limited_to_200_chars(client, http) -> None:
+    client.create_page("db", _SETTINGS, _build_note("A" * 250))
+
+    assert http.calls[-1][1]["json"] == _expected_page_payload("A" * 200)
+
+
+def test_create_page_uses_default_title_when_empty(client, http) -> None:
+    client.create_page("db", _SETTINGS, _build_note("   "))
+
+    assert http.calls[-1][1]["json"] == _expected_page_payload("Sin título")
+
+
+def test_create_task_from_action_builds_expected_payload(client, http) -> None:
+    http.response = _TASK_RESPONSE
+    note = _build_note("Nota madre")
+
+    task_id = client.create_task_from_action(_SETTINGS, "  Hacer seguimiento con cliente  ", note)
+
+    assert task_id == "task_1"
+    assert http.calls[-1][1]["json"] == {
+        "parent": {"database_id": _SETTINGS.notion_database_id},
+        "properties": {
+            _SETTINGS.prop_title: {"title": [{"text": {"content": "Hacer seguimiento con cliente"}}]},
+            _SETTINGS.prop_area: {"select": {"name": note.area}},
+            _SETTINGS.prop_tipo: {"select": {"name": "Tarea"}},
+            _SETTINGS.prop_estado: {"select": {"name": "Pendiente"}},
+            _SETTINGS.prop_fecha: {"date": {"start": note.fecha}},
+            _SETTINGS.prop_prioridad: {"select": {"name": note.prioridad}},
+            "Origen": {"select": {"name": "Sistema"}},
+            "Fuente_ID": _rich_text(str(note.source_id)),
+            "Raw": _rich_text("Hacer seguimiento con cliente"),
+        },
+    }
+
+
+def test_update_page_status_uses_estado_property(client, http) -> None:
+    client.update_page_status("page_1", "Finalizado")
+
+    args, kwargs = http.calls[-1]
+    assert args[0] == "https://api.notion.com/v1/pages/page_1"
+    assert kwargs["json"] == {"properties": {"Estado": {"select": {"name": "Finalizado"}}}}
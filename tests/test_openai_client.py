@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from app.utils import openai_client
+
+
+@pytest.fixture
+def key_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "KeySecret.txt"
+    monkeypatch.setattr(openai_client, "_KEY_STR", str(path))
+    openai_client.clear_api_key_cache()
+    yield path
+    openai_client.clear_api_key_cache()
+
+
+def test_load_api_key_reutiliza_la_clave_mientras_el_fichero_no_cambia(
+    key_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key_file.write_text("sk-uno\n", encoding="utf-8")
+    assert openai_client.load_api_key() == "sk-uno"
+
+    reads: list[str] = []
+
+    def _spy_open(file, *args, **kwargs):
+        reads.append(file)
+        return open(file, *args, **kwargs)
+
+    monkeypatch.setattr(openai_client, "open", _spy_open, raising=False)
+    assert openai_client.load_api_key() == "sk-uno"
+    assert reads == []
+
+    key_file.write_text("sk-dos", encoding="utf-8")
+    stat = key_file.stat()
+    os.utime(key_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert openai_client.load_api_key() == "sk-dos"
+    assert reads == [str(key_file)]
+
+
+def test_load_api_key_falla_si_no_existe_o_es_invalida(key_file: Path) -> None:
+    with pytest.raises(RuntimeError, match="No se encontró"):
+        openai_client.load_api_key()
+
+    for contenido in ("clave-mala", "", "sk-clave-con-ñ"):
+        key_file.write_text(contenido, encoding="utf-8")
+        with pytest.raises(RuntimeError, match="inválida"):
+            openai_client.load_api_key()
+
+
+def test_build_openai_client_reutiliza_el_cliente_mientras_no_cambia_la_clave(
+    key_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import sys
+    import types
+
+    created: list[str] = []
+
+    class _FakeOpenAI:
+        def __init__(self, api_key: str, timeout: float) -> None:
+            created.append(api_key)
+
+    monkeypatch.setattr(openai_client, "_OPENAI_CLASS", None)
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=_FakeOpenAI))
+    key_file.write_text("sk-uno", encoding="utf-8")
+
+    first = openai_client.build_openai_client()
+    assert openai_client.build_openai_client() is first
+
+    key_file.write_text("sk-dos", encoding="utf-8")
+    stat = key_file.stat()
+    os.utime(key_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert openai_client.build_openai_client() is not first
+    assert created == ["sk-uno", "sk-dos"]
+
+
+def test_openai_class_se_importa_una_sola_vez(monkeypatch: pytest.MonkeyPatch) -> None:
+    import sys
+    import types
+
+    sentinel = object()
+    monkeypatch.setattr(openai_client, "_OPENAI_CLASS", None)
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=sentinel))
+    assert openai_client._openai_class() is sentinel
+
+    monkeypatch.delitem(sys.modules, "openai")
+    assert openai_client._openai_class() is sentinel
@@ -1,101 +1,87 @@
-import unittest
 from types import SimpleNamespace
-from unittest.mock import patch
-
-from app.core.processor import SYSTEM_PROMPT, process_text
-
-
-class ProcessorTests(unittest.TestCase):
-    def test_system_prompt_includes_mode_analysis_requirements(self):
-        self.assertIn("Extraer acciones operativas del texto", SYSTEM_PROMPT)
-        self.assertIn("Determinar si las acciones deben ser simples o desglosadas", SYSTEM_PROMPT)
-        self.assertIn("TIPOS PERMITIDOS", SYSTEM_PROMPT)
-        self.assertIn('"tipo_accion": ["..."]', SYSTEM_PROMPT)
-
-    @patch("app.core.processor.build_openai_client")
-    def test_acciones_stringified_list_is_normalized(self, mock_build_client):
-        mock_build_client.return_value = SimpleNamespace(
-            responses=SimpleNamespace(
-                create=lambda **_: SimpleNamespace(
-                    output_text="""{"resumen": "R", "acciones": "[' A1 ', '', 'A2']", "tipo_sugerido": "Nota", "prioridad_sugerida": "Media"}"""
-                )
-            )
-        )
-
-        processed = process_text("texto")
-
-        self.assertEqual(processed.acciones, ["A1", "A2"])
-
-    @patch("app.core.processor.build_openai_client")
-    def test_acciones_invalid_string_falls_back_to_single_item(self, mock_build_client):
-        mock_build_client.return_value = SimpleNamespace(
-            responses=SimpleNamespace(
-                create=lambda **_: SimpleNamespace(
-                    output_text='{"resumen": "R", "acciones": "Acción sin formato"}'
-                )
-            )
-        )
-
-        processed = process_text("texto")
-
-        self.assertEqual(processed.acciones, ["Acción sin formato"])
-
-    @patch("app.core.processor.build_openai_client")
-    def test_acciones_non_list_is_wrapped(self, mock_build_client):
-        mock_build_client.return_value = SimpleNamespace(
-            responses=SimpleNamespace(
-                create=lambda **_: SimpleNamespace(
-                    output_text='{"resumen": "R", "acciones": 42}'
-                )
-            )
-        )
-
-        processed = process_text("texto")
-
-        self.assertEqual(processed.acciones, ["42"])
-
-    @patch("app.core.processor.build_openai_client")
-    def test_acciones_multiline_are_split_as_individual_actions(self, mock_build_client):
-        mock_build_client.return_value = SimpleNamespace(
-            responses=SimpleNamespace(
-                create=lambda **_: SimpleNamespace(
-                    output_text='{"resumen": "R", "acciones": ["- A1\\n- A2"]}'
-                )
-            )
-        )
-
-        processed = process_text("texto")
-
-        self.assertEqual(processed.acciones, ["A1", "A2"])
-
-    @patch("app.core.processor.build_openai_client")
-    def test_acciones_object_with_subtasks_is_flattened(self, mock_build_client):
-        mock_build_client.return_value = SimpleNamespace(
-            responses=SimpleNamespace(
-                create=lambda **_: SimpleNamespace(
-                    output_text='{"acciones": [{"descripcion": "Acción principal", "subtareas": ["Paso 1", "Paso 2"]}]}'
-                )
-            )
-        )
-
-        processed = process_text("texto")
-
-        self.assertEqual(processed.acciones, ["Acción principal", "Paso 1", "Paso 2"])
-
-    @patch("app.core.processor.build_openai_client")
-    def test_acciones_object_with_tipo_accion_is_appended_to_description(self, mock_build_client):
-        mock_build_client.return_value = SimpleNamespace(
-            responses=SimpleNamespace(
-                create=lambda **_: SimpleNamespace(
-                    output_text='{"acciones": [{"descripcion": "Llamar al cliente", "subtareas": [], "tipo_accion": ["Llamar", "Seguimiento"]}]}'
-                )
-            )
-        )
-
-        processed = process_text("texto")
-
-        self.assertEqual(processed.acciones, ["Llamar al cliente [Tipo: Llamar, Seguimiento]"])
-
-
-if __name__ == "__main__":
-    unittest.main()
+
+import pytest
+
+from app.core import processor
+from app.core.processor import SYSTEM_PROMPT, ProcessedNote, _processed_note_from_payload, process_text
+
+
+class _FakeResponses:
+    def __init__(self):
+        self.output_text = ""
+
+    def create(self, **_kwargs):
+        return SimpleNamespace(output_text=self.output_text)
+
+
+class _FakeOpenAI:
+    def __init__(self):
+        self.responses = _FakeResponses()
+
+
+@pytest.fixture
+def openai_output(monkeypatch: pytest.MonkeyPatch):
+    client = _FakeOpenAI()
+    monkeypatch.setattr(processor, "build_openai_client", lambda: client)
+
+    def _set(output_text: str) -> None:
+        client.responses.output_text = output_text
+
+    return _set
+
+
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "Extraer acciones operativas del texto",
+        "Determinar si las acciones deben ser simples o desglosadas",
+        "TIPOS PERMITIDOS",
+        '"tipo_accion": ["..."]',
+    ],
+)
+def test_system_prompt_includes_mode_analysis_requirements(needle: str) -> None:
+    assert needle in SYSTEM_PROMPT
+
+
+def test_process_text_parses_model_output(openai_output) -> None:
+    openai_output(
+        'Respuesta:\n{"resumen": " R ", "acciones": ["A1"], "tipo_sugerido": "Nota", "prioridad_sugerida": "Media"}'
+    )
+
+    assert process_text("texto") == ProcessedNote("R", ["A1"], "Nota", "Media")
+
+
+# Los casos de normalización parten del objeto ya parseado: no dependen del cliente ni de json.loads.
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        pytest.param(
+            {"resumen": "R", "acciones": "[' A1 ', '', 'A2']", "tipo_sugerido": "Nota", "prioridad_sugerida": "Media"},
+            ["A1", "A2"],
+            id="stringified_list_is_normalized",
+        ),
+        pytest.param(
+            {"resumen": "R", "acciones": "Acción sin formato"},
+            ["Acción sin formato"],
+            id="invalid_string_falls_back_to_single_item",
+        ),
+        pytest.param({"resumen": "R", "acciones": 42}, ["42"], id="non_list_is_wrapped"),
+        pytest.param(
+            {"resumen": "R", "acciones": ["- A1\n- A2"]},
+            ["A1", "A2"],
+            id="multiline_are_split_as_individual_actions",
+        ),
+        pytest.param(
+            {"acciones": [{"descripcion": "Acción principal", "subtareas": ["Paso 1", "Paso 2"]}]},
+            ["Acción principal", "Paso 1", "Paso 2"],
+            id="object_with_subtasks_is_flattened",
+        ),
+        pytest.param(
+            {"acciones": [{"descripcion": "Llamar al cliente", "subtareas": [], "tipo_accion": ["Llamar", "Seguimiento"]}]},
+            ["Llamar al cliente [Tipo: Llamar, Seguimiento]"],
+            id="object_with_tipo_accion_is_appended_to_description",
+        ),
+    ],
+)
+def test_acciones_are_normalized(payload: dict, expected: list[str]) -> None:
+    assert _processed_note_from_payload(payload).acciones == expected
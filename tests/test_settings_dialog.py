@@ -0,0 +1,30 @@
+from dataclasses import fields
+import tkinter
+import types
+
+from app.core.models import AppSettings
+from app.ui.settings_dialog import SettingsDialog
+
+
+def test_campos_de_texto_usan_los_valores_por_defecto_de_app_settings() -> None:
+    defaults = {field.name: field.default for field in fields(AppSettings)}
+
+    for key, default in SettingsDialog._SETTINGS_TEXT_FIELDS:
+        assert defaults[key] == default
+    assert {key for key, _ in SettingsDialog._SETTINGS_TEXT_FIELDS} == {
+        name for name, value in defaults.items() if isinstance(value, str)
+    }
+
+
+def test_load_config_rellena_los_campos_de_texto_desde_la_tabla() -> None:
+    interp = tkinter.Tcl()
+    dialog = SettingsDialog.__new__(SettingsDialog)
+    dialog._current = AppSettings(notion_token="token", default_estado="")
+    dialog.config_manager = types.SimpleNamespace(load=lambda: {})
+    dialog.config_vars = {key: tkinter.StringVar(master=interp) for key, _ in SettingsDialog._SETTINGS_TEXT_FIELDS}
+
+    dialog._load_config()
+
+    assert dialog.config_vars["notion_token"].get() == "token"
+    assert dialog.config_vars["default_estado"].get() == "Pendiente"
+    assert dialog.config_vars["prop_title"].get() == "Actividad"
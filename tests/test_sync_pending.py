@@ -1,12 +1,18 @@
+import sqlite3
 import unittest
 from unittest.mock import patch
 
 from app.core.models import AppSettings, NoteCreateRequest, NoteStatus
 from app.core.service import NoteService
-from app.persistence.db import Database
 from app.persistence.masters_repository import MastersRepository
 from app.persistence.repositories import ActionsRepository, NoteRepository, SettingsRepository
 
+from db_helpers import migrated_connection
+
+
+# Marca de creación fija para las notas de prueba: no hace falta consultar el reloj.
+_CREATED_AT = "2025-01-01T00:00:00"
+
 
 class _FakeNotionClient:
     created_tasks = []
@@ -34,19 +40,19 @@ class _FakeNotionClientWithTaskError(_FakeNotionClient):
         raise RuntimeError("boom")
 
 
+def _build_service(conn: sqlite3.Connection) -> NoteService:
+    return NoteService(
+        NoteRepository(conn),
+        SettingsRepository(conn),
+        MastersRepository(conn),
+        ActionsRepository(conn),
+    )
+
+
 class SyncPendingTaskCreationTests(unittest.TestCase):
     def setUp(self):
-        self.db = Database(DatabasePathHelper.path())
-        self.db.migrate()
-        self.conn = self.db.connect()
-        self.service = NoteService(
-            NoteRepository(self.conn),
-            SettingsRepository(self.conn),
-            MastersRepository(self.conn),
-            ActionsRepository(self.conn),
-        )
-        _FakeNotionClient.created_tasks = []
-
+        self.conn = migrated_connection()
+        self.service = _build_service(self.conn)
         self.service.save_settings(
             AppSettings(
                 notion_token="token",
@@ -54,32 +60,41 @@ class SyncPendingTaskCreationTests(unittest.TestCase):
                 notion_enabled=True,
             )
         )
+        _FakeNotionClient.created_tasks = []
 
     def tearDown(self):
         self.conn.close()
 
-    def _create_note(self, acciones: str) -> int:
-        return self.service.note_repo.create_note(
-            NoteCreateRequest(
-                title="Nota",
-                raw_text="Texto",
-                source="manual",
-                area="Operaciones",
-                tipo="Nota",
-                estado="Pendiente",
-                prioridad="Media",
-                fecha="2025-01-01",
-                resumen="",
-                acciones=acciones,
+    def _create_notes(self, *acciones: str) -> list[int]:
+        """Insert one pending note per ``acciones`` text in a single batch and return their ids."""
+        source_ids = [f"src-{text}" for text in acciones]
+        ids = self.service.note_repo.create_notes(
+            (
+                (
+                    NoteCreateRequest(
+                        title="Nota",
+                        raw_text="Texto",
+                        source="manual",
+                        area="Operaciones",
+                        tipo="Nota",
+                        estado="Pendiente",
+                        prioridad="Media",
+                        fecha="2025-01-01",
+                        resumen="",
+                        acciones=text,
+                    ),
+                    source_id,
+                )
+                for text, source_id in zip(acciones, source_ids)
             ),
-            source_id=f"src-{acciones}",
-            created_at=AppSettings.now_iso(),
+            created_at=_CREATED_AT,
             status=NoteStatus.PENDING,
         )
+        return [ids[source_id] for source_id in source_ids]
 
     @patch("app.core.service.NotionClient", _FakeNotionClient)
     def test_sync_pending_creates_task_per_action(self):
-        note_id = self._create_note("Acción 1\n\nAcción 2\n")
+        (note_id,) = self._create_notes("Acción 1\n\nAcción 2\n")
 
         sent, failed = self.service.sync_pending()
 
@@ -90,7 +105,7 @@ class SyncPendingTaskCreationTests(unittest.TestCase):
 
     @patch("app.core.service.NotionClient", _FakeNotionClientWithTaskError)
     def test_sync_pending_does_not_fail_when_task_creation_fails(self):
-        note_id = self._create_note("Acción 1")
+        (note_id,) = self._create_notes("Acción 1")
 
         sent, failed = self.service.sync_pending()
 
@@ -99,15 +114,23 @@ class SyncPendingTaskCreationTests(unittest.TestCase):
         self.assertEqual(synced.status, "enviado")
 
 
-class DatabasePathHelper:
-    @staticmethod
-    def path():
-        from pathlib import Path
+    @patch("app.core.service.NotionClient", _FakeNotionClient)
+    def test_sync_pending_sends_every_note_of_a_batch(self):
+        first_id, second_id = self._create_notes("Llamar", "Enviar oferta\nRevisar contrato")
 
-        temp = Path("tests") / "tmp_sync_pending.db"
-        if temp.exists():
-            temp.unlink()
-        return temp
+        sent, failed = self.service.sync_pending()
+
+        self.assertEqual((sent, failed), (2, 0))
+        self.assertEqual(
+            sorted(_FakeNotionClient.created_tasks),
+            sorted(
+                [
+                    (first_id, "Llamar"),
+                    (second_id, "Enviar oferta"),
+                    (second_id, "Revisar contrato"),
+                ]
+            ),
+        )
 
 
 if __name__ == "__main__":
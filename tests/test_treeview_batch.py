@@ -0,0 +1,14 @@
+import tkinter
+
+from app.ui.treeview_batch import tcl_escape
+
+
+def test_tcl_escape_conserva_el_texto_original() -> None:
+    tcl = tkinter.Tcl()
+    samples = ["", " ", "a b", "{abierta", "}", "[exec ls]", "$HOME", "a\\b", "línea 1\nlínea 2", '"q"', "fin;", "\ttab", "x\x0cy", "x\x0by", "x\x00y", "\r\n"]
+
+    for sample in samples:
+        assert tcl.eval(f"set valor {tcl_escape(sample)}") == sample
+        # llength/lindex en Tcl: splitlist no admite NUL en el resultado.
+        assert tcl.eval(f"llength [list {tcl_escape(sample)} x]") == "2"
+        assert tcl.eval(f"lindex [list {tcl_escape(sample)} x] 0") == sample
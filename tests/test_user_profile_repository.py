@@ -5,7 +5,7 @@ from app.persistence.user_profile_repository import UserProfileRepository
 
 
 def test_user_profile_singleton_and_save(tmp_path) -> None:
-    db = Database(tmp_path / "notes.db")
+    db = Database(tmp_path / "notes.db", durable=False)
     db.migrate()
     conn = db.connect()
     repo = UserProfileRepository(conn)
@@ -35,7 +35,7 @@ def test_user_profile_singleton_and_save(tmp_path) -> None:
 
 
 def test_migrate_managed_email_from_legacy_db(tmp_path) -> None:
-    current_db = Database(tmp_path / "current" / "notes.db")
+    current_db = Database(tmp_path / "current" / "notes.db", durable=False)
     current_db.migrate()
     conn = current_db.connect()
     repo = UserProfileRepository(conn)
@@ -55,7 +55,7 @@ def test_migrate_managed_email_from_legacy_db(tmp_path) -> None:
 
 
 def test_migrate_managed_email_from_legacy_settings_fallback(tmp_path) -> None:
-    current_db = Database(tmp_path / "current" / "notes.db")
+    current_db = Database(tmp_path / "current" / "notes.db", durable=False)
     current_db.migrate()
     conn = current_db.connect()
     repo = UserProfileRepository(conn)